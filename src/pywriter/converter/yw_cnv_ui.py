@@ -50,19 +50,23 @@ class YwCnvUi:
         Error handling:
         - If the conversion fails, newFile is set to None.
         """
+        normTargetPath = norm_path(target.filePath)
         self.ui.set_info_what(
-            _('Input: {0} "{1}"\nOutput: {2} "{3}"').format(source.DESCRIPTION, norm_path(source.filePath), target.DESCRIPTION, norm_path(target.filePath)))
+            _('Input: {0} "{1}"\nOutput: {2} "{3}"').format(source.DESCRIPTION, norm_path(source.filePath), target.DESCRIPTION, normTargetPath))
         try:
             self.check(source, target)
             source.novel = Novel()
             source.read()
+            source.tree = None
+            # The source is not written back when exporting;
+            # free its xml tree before the target builds its output.
             target.novel = source.novel
             target.write()
         except Exception as ex:
             message = f'!{str(ex)}'
             self.newFile = None
         else:
-            message = f'{_("File written")}: "{norm_path(target.filePath)}".'
+            message = f'{_("File written")}: "{normTargetPath}".'
             self.newFile = target.filePath
         finally:
             self.ui.set_info_how(message)
@@ -85,10 +89,11 @@ class YwCnvUi:
           an error message is sent to the UI.
         - If the conversion fails, newFile is set to None.
         """
+        normTargetPath = norm_path(target.filePath)
         self.ui.set_info_what(
-            _('Create a yWriter project file from {0}\nNew project: "{1}"').format(source.DESCRIPTION, norm_path(target.filePath)))
+            _('Create a yWriter project file from {0}\nNew project: "{1}"').format(source.DESCRIPTION, normTargetPath))
         if os.path.isfile(target.filePath):
-            self.ui.set_info_how(f'!{_("File already exists")}: "{norm_path(target.filePath)}".')
+            self.ui.set_info_how(f'!{_("File already exists")}: "{normTargetPath}".')
         else:
             try:
                 self.check(source, target)
@@ -100,7 +105,7 @@ class YwCnvUi:
                 message = f'!{str(ex)}'
                 self.newFile = None
             else:
-                message = f'{_("File written")}: "{norm_path(target.filePath)}".'
+                message = f'{_("File written")}: "{normTargetPath}".'
                 self.newFile = target.filePath
             finally:
                 self.ui.set_info_how(message)
@@ -122,8 +127,9 @@ class YwCnvUi:
         Error handling:
         - If the conversion fails, newFile is set to None.
         """
+        normTargetPath = norm_path(target.filePath)
         self.ui.set_info_what(
-            _('Input: {0} "{1}"\nOutput: {2} "{3}"').format(source.DESCRIPTION, norm_path(source.filePath), target.DESCRIPTION, norm_path(target.filePath)))
+            _('Input: {0} "{1}"\nOutput: {2} "{3}"').format(source.DESCRIPTION, norm_path(source.filePath), target.DESCRIPTION, normTargetPath))
         self.newFile = None
         try:
             self.check(source, target)
@@ -136,7 +142,7 @@ class YwCnvUi:
         except Exception as ex:
             message = f'!{str(ex)}'
         else:
-            message = f'{_("File written")}: "{norm_path(target.filePath)}".'
+            message = f'{_("File written")}: "{normTargetPath}".'
             self.newFile = target.filePath
             if target.scenesSplit:
                 self.ui.show_warning(_('New scenes created during conversion.'))
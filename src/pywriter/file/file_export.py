@@ -624,20 +624,28 @@ class FileExport(File):
             lines.append(template.safe_substitute(map))
         return lines
 
+    def _iter_text(self):
+        """Call all processing methods.
+        
+        Yield the chunks of text to be written to the output file,
+        avoiding a transient list of all template expansions.
+        This is a template method that can be extended or overridden by subclasses.
+        """
+        yield from self._get_fileHeader()
+        yield from self._get_chapters()
+        yield from self._get_characters()
+        yield from self._get_locations()
+        yield from self._get_items()
+        yield from self._get_projectNotes()
+        yield self._fileFooter
+
     def _get_text(self):
         """Call all processing methods.
         
         Return a string to be written to the output file.
         This is a template method that can be extended or overridden by subclasses.
         """
-        lines = self._get_fileHeader()
-        lines.extend(self._get_chapters())
-        lines.extend(self._get_characters())
-        lines.extend(self._get_locations())
-        lines.extend(self._get_items())
-        lines.extend(self._get_projectNotes())
-        lines.append(self._fileFooter)
-        return ''.join(lines)
+        return ''.join(self._iter_text())
 
     def write(self):
         """Write instance variables to the export file.
@@ -646,7 +654,6 @@ class FileExport(File):
         Return a message in case of success.
         Raise the "Error" exception in case of error. 
         """
-        text = self._get_text()
         backedUp = False
         if os.path.isfile(self.filePath):
             try:
@@ -657,7 +664,8 @@ class FileExport(File):
                 backedUp = True
         try:
             with open(self.filePath, 'w', encoding='utf-8') as f:
-                f.write(text)
+                for text in self._iter_text():
+                    f.write(text)
         except:
             if backedUp:
                 os.replace(f'{self.filePath}.bak', self.filePath)
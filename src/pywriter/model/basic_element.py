@@ -14,9 +14,16 @@ class BasicElement:
         desc: str -- description.
         kwVar: dict -- custom keyword variables.
     """
+    __slots__ = ('title', 'desc', 'kwVar')
+    # No instance dict; attribute access is a fixed slot lookup.
 
     def __init__(self):
-        """Initialize instance variables."""
+        """Initialize instance variables.
+
+        Subclasses assign all their instance variables here, with
+        defaults, so the instance dict keeps one shape; CPython's
+        attribute caches stay valid that way.
+        """
         self.title: str = None
         # xml: <Title>
 
@@ -19,6 +19,7 @@ class Character(WorldElement):
     """
     MAJOR_MARKER: str = 'Major'
     MINOR_MARKER: str = 'Minor'
+    __slots__ = ('notes', 'bio', 'goals', 'fullName', 'isMajor')
 
     def __init__(self):
         """Extends the superclass constructor by adding instance variables."""
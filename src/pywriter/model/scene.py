@@ -30,12 +30,15 @@ class Scene(BasicElement):
     Public instance variables:
         sceneContent: str -- scene content (property with getter and setter).
         wordCount: int -- word count (derived; updated by the sceneContent setter).
+        wordCountStr: str -- word count as string (derived; cached per content change).
         letterCount: int -- letter count (derived; updated by the sceneContent setter).
+        letterCountStr: str -- letter count as string (derived; cached per content change).
         scType: int -- Scene type (Normal/Notes/Todo/Unused).
         doNotExport: bool -- True if the scene is not to be exported to RTF.
         status: int -- scene status (Outline/Draft/1st Edit/2nd Edit/Done).
         notes: str -- scene notes in a single string.
-        tags -- list of scene tags. 
+        tags -- list of scene tags (property with getter and setter).
+        tagsStr: str -- semicolon-concatenated tags (derived; updated by the tags setter).
         field1: int -- scene ratings field 1.
         field2: int -- scene ratings field 2.
         field3: int -- scene ratings field 3.
@@ -68,6 +71,14 @@ class Scene(BasicElement):
     REACTION_MARKER: str = 'R'
     NULL_DATE: str = '0001-01-01'
     NULL_TIME: str = '00:00:00'
+    __slots__ = ('_sceneContent', 'wordCount', '_wordCountStr',
+                 'letterCount', '_letterCountStr', 'scType',
+                 'doNotExport', 'status', 'notes', '_tags', '_tagsStr',
+                 'field1', 'field2', 'field3', 'field4', 'appendToPrev',
+                 'isReactionScene', 'isSubPlot', 'goal', 'conflict',
+                 'outcome', 'characters', 'locations', 'items', 'date',
+                 'time', 'day', 'lastsMinutes', 'lastsHours', 'lastsDays',
+                 'image', 'scnArcs', 'scnStyle')
 
     def __init__(self):
         """Initialize instance variables.
@@ -84,10 +95,16 @@ class Scene(BasicElement):
         # xml: <WordCount>
         # To be updated by the sceneContent setter
 
+        self._wordCountStr: str = None
+        # Word count as string, cached for repeated writing.
+
         self.letterCount: int = 0
         # xml: <LetterCount>
         # To be updated by the sceneContent setter
 
+        self._letterCountStr: str = None
+        # Letter count as string, cached for repeated writing.
+
         self.scType: int = None
         # Scene type (Normal/Notes/Todo/Unused).
         #
@@ -129,9 +146,12 @@ class Scene(BasicElement):
         self.notes: str = None
         # xml: <Notes>
 
-        self.tags: list[str] = None
+        self._tags: list[str] = None
         # xml: <Tags>
 
+        self._tagsStr: str = None
+        # Semicolon-concatenated tags, cached for repeated writing.
+
         self.field1: str = None
         # xml: <Field1>
 
@@ -208,6 +228,37 @@ class Scene(BasicElement):
         # May be 'explaining', 'descriptive', or 'summarizing'.
         # None is the default, meaning 'staged'.
 
+    @property
+    def tags(self) -> list:
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: list):
+        """Set tags, invalidating the cached concatenation."""
+        self._tags = tags
+        self._tagsStr = None
+
+    @property
+    def tagsStr(self) -> str:
+        """Return the semicolon-concatenated tags, caching the result."""
+        if self._tagsStr is None and self._tags is not None:
+            self._tagsStr = list_to_string(self._tags)
+        return self._tagsStr
+
+    @property
+    def wordCountStr(self) -> str:
+        """Return the word count as string, caching the result."""
+        if self._wordCountStr is None:
+            self._wordCountStr = str(self.wordCount)
+        return self._wordCountStr
+
+    @property
+    def letterCountStr(self) -> str:
+        """Return the letter count as string, caching the result."""
+        if self._letterCountStr is None:
+            self._letterCountStr = str(self.letterCount)
+        return self._letterCountStr
+
     @property
     def sceneContent(self) -> str:
         return self._sceneContent
@@ -216,6 +267,8 @@ class Scene(BasicElement):
     def sceneContent(self, text: str):
         """Set sceneContent updating word count and letter count."""
         self._sceneContent = text
+        self._wordCountStr = None
+        self._letterCountStr = None
         text = ADDITIONAL_WORD_LIMITS.sub(' ', text)
         text = NO_WORD_LIMITS.sub('', text)
         wordList = text.split()
@@ -5,6 +5,7 @@ For further information see https://github.com/peter88213/PyWriter
 Published under the MIT License (https://opensource.org/licenses/mit-license.php)
 """
 from pywriter.model.basic_element import BasicElement
+from pywriter.pywriter_globals import *
 
 
 class WorldElement(BasicElement):
@@ -12,9 +13,11 @@ class WorldElement(BasicElement):
     
     Public instance variables:
         image: str -- image file path.
-        tags -- list of tags.
+        tags -- list of tags (property with getter and setter).
+        tagsStr: str -- semicolon-concatenated tags (derived; updated by the tags setter).
         aka: str -- alternate name.
     """
+    __slots__ = ('image', '_tags', '_tagsStr', 'aka')
 
     def __init__(self):
         """Initialize instance variables.
@@ -26,9 +29,29 @@ class WorldElement(BasicElement):
         self.image: str = None
         # xml: <ImageFile>
 
-        self.tags: list[str] = None
+        self._tags: list[str] = None
         # xml: <Tags>
 
+        self._tagsStr: str = None
+        # Semicolon-concatenated tags, cached for repeated writing.
+
         self.aka: str = None
         # xml: <AKA>
 
+    @property
+    def tags(self) -> list:
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: list):
+        """Set tags, invalidating the cached concatenation."""
+        self._tags = tags
+        self._tagsStr = None
+
+    @property
+    def tagsStr(self) -> str:
+        """Return the semicolon-concatenated tags, caching the result."""
+        if self._tagsStr is None and self._tags is not None:
+            self._tagsStr = list_to_string(self._tags)
+        return self._tagsStr
+
@@ -6,22 +6,35 @@ Published under the MIT License (https://opensource.org/licenses/mit-license.php
 """
 
 
-def indent(elem, level=0):
+def indent(elem):
     """xml pretty printer
 
-    Kudos to to Fredrik Lundh. 
+    Kudos to to Fredrik Lundh.
     Source: http://effbot.org/zone/element-lib.htm#prettyprint
+
+    Iterative variant of the recipe, using an explicit stack instead of
+    one Python call per element. This avoids call overhead on big trees
+    and cannot hit the recursion limit, however deeply scenes are nested.
     """
-    i = f'\n{level * "  "}'
-    if elem:
+    stack = [(elem, 0)]
+    while stack:
+        elem, level = stack.pop()
+        if not len(elem):
+            continue
+
+        i = f'\n{level * "  "}'
+        childIndent = f'{i}  '
         if not elem.text or not elem.text.strip():
-            elem.text = f'{i}  '
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-        for elem in elem:
-            indent(elem, level + 1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
+            elem.text = childIndent
+        if not level and (not elem.tail or not elem.tail.strip()):
             elem.tail = i
+        lastChild = elem[-1]
+        for child in elem:
+            # Each child's tail indents the next sibling;
+            # the last child's tail dedents the parent's closing tag.
+            if not child.tail or not child.tail.strip():
+                if child is lastChild:
+                    child.tail = i
+                else:
+                    child.tail = childIndent
+            stack.append((child, level + 1))
@@ -8,9 +8,13 @@ Published under the MIT License (https://opensource.org/licenses/mit-license.php
 """
 import os
 import re
+import sys
+from io import BytesIO
 from html import unescape
 from datetime import datetime
 import xml.etree.ElementTree as ET
+# Backed by the C accelerator module; lxml is deliberately not used,
+# because the distributed script must run on a plain Python installation.
 from pywriter.pywriter_globals import *
 from pywriter.model.chapter import Chapter
 from pywriter.model.scene import Scene
@@ -50,6 +54,10 @@ class Yw7File(File):
     # Names of xml elements containing CDATA.
     # ElementTree.write omits CDATA tags, so they have to be inserted afterwards.
 
+    _CDATA_OPEN = re.compile(f'<({"|".join(map(re.escape, _CDATA_TAGS))})>')
+    _CDATA_CLOSE = re.compile(f'</({"|".join(map(re.escape, _CDATA_TAGS))})>')
+    # One alternation per direction instead of one pattern per tag.
+
     PRJ_KWVAR = [
         'Field_LanguageCode',
         'Field_CountryCode',
@@ -59,6 +67,44 @@ class Yw7File(File):
         'Field_SceneStyle',
         ]
 
+    _PRJ_FIELDS = (
+        ('title', 'Title'),
+        ('authorName', 'AuthorName'),
+        ('authorBio', 'Bio'),
+        ('desc', 'Desc'),
+        ('fieldTitle1', 'FieldTitle1'),
+        ('fieldTitle2', 'FieldTitle2'),
+        ('fieldTitle3', 'FieldTitle3'),
+        ('fieldTitle4', 'FieldTitle4'),
+        )
+    _WLD_FIELDS = (
+        ('title', 'Title'),
+        ('image', 'ImageFile'),
+        ('desc', 'Desc'),
+        ('aka', 'AKA'),
+        ('tagsStr', 'Tags'),
+        )
+    _SCN_FIELDS = (
+        ('notes', 'Notes'),
+        ('tagsStr', 'Tags'),
+        ('field1', 'Field1'),
+        ('field2', 'Field2'),
+        ('field3', 'Field3'),
+        ('field4', 'Field4'),
+        )
+    _SCN_DURATION_FIELDS = (
+        ('lastsDays', 'LastsDays'),
+        ('lastsHours', 'LastsHours'),
+        ('lastsMinutes', 'LastsMinutes'),
+        )
+    _SCN_PLOT_FIELDS = (
+        ('goal', 'Goal'),
+        ('conflict', 'Conflict'),
+        ('outcome', 'Outcome'),
+        ('image', 'ImageFile'),
+        )
+    # (instance variable, xml tag) pairs, driving the read and write loops.
+
     def __init__(self, filePath, **kwargs):
         """Initialize instance variables.
         
@@ -81,43 +127,24 @@ class Yw7File(File):
         Overrides the superclass method.
         """
 
-        def read_project(root):
+        def read_project(prj):
             #--- Read attributes at project level from the xml element tree.
-            prj = root.find('PROJECT')
-
-            if prj.find('Title') is not None:
-                self.novel.title = prj.find('Title').text
-
-            if prj.find('AuthorName') is not None:
-                self.novel.authorName = prj.find('AuthorName').text
-
-            if prj.find('Bio') is not None:
-                self.novel.authorBio = prj.find('Bio').text
-
-            if prj.find('Desc') is not None:
-                self.novel.desc = prj.find('Desc').text
-
-            if prj.find('FieldTitle1') is not None:
-                self.novel.fieldTitle1 = prj.find('FieldTitle1').text
-
-            if prj.find('FieldTitle2') is not None:
-                self.novel.fieldTitle2 = prj.find('FieldTitle2').text
-
-            if prj.find('FieldTitle3') is not None:
-                self.novel.fieldTitle3 = prj.find('FieldTitle3').text
-
-            if prj.find('FieldTitle4') is not None:
-                self.novel.fieldTitle4 = prj.find('FieldTitle4').text
+            for attrName, tag in self._PRJ_FIELDS:
+                xmlElement = prj.find(tag)
+                if xmlElement is not None:
+                    setattr(self.novel, attrName, xmlElement.text)
 
             #--- Read word target data.
-            if prj.find('WordCountStart') is not None:
+            xmlElement = prj.find('WordCountStart')
+            if xmlElement is not None:
                 try:
-                    self.novel.wordCountStart = int(prj.find('WordCountStart').text)
+                    self.novel.wordCountStart = int(xmlElement.text)
                 except:
                     self.novel.wordCountStart = 0
-            if prj.find('WordTarget') is not None:
+            xmlElement = prj.find('WordTarget')
+            if xmlElement is not None:
                 try:
-                    self.novel.wordTarget = int(prj.find('WordTarget').text)
+                    self.novel.wordTarget = int(xmlElement.text)
                 except:
                     self.novel.wordTarget = 0
 
@@ -138,149 +165,159 @@ class Yw7File(File):
             if self.novel.kwVar['Field_CountryCode']:
                 self.novel.countryCode = self.novel.kwVar['Field_CountryCode']
 
-        def read_locations(root):
-            #--- Read locations from the xml element tree.
-            self.novel.srtLocations = []
-            # This is necessary for re-reading.
-            for loc in root.iter('LOCATION'):
-                lcId = loc.find('ID').text
-                self.novel.srtLocations.append(lcId)
-                self.novel.locations[lcId] = WorldElement()
+        def read_location(loc):
+            #--- Read a location from the xml element tree.
+            lcId = loc.find('ID').text
+            appendLcId(lcId)
+            self.novel.locations[lcId] = WorldElement()
+
+            xmlElement = loc.find('Title')
+            if xmlElement is not None:
+                self.novel.locations[lcId].title = xmlElement.text
 
-                if loc.find('Title') is not None:
-                    self.novel.locations[lcId].title = loc.find('Title').text
+            xmlElement = loc.find('ImageFile')
+            if xmlElement is not None:
+                self.novel.locations[lcId].image = xmlElement.text
 
-                if loc.find('ImageFile') is not None:
-                    self.novel.locations[lcId].image = loc.find('ImageFile').text
+            xmlElement = loc.find('Desc')
+            if xmlElement is not None:
+                self.novel.locations[lcId].desc = xmlElement.text
 
-                if loc.find('Desc') is not None:
-                    self.novel.locations[lcId].desc = loc.find('Desc').text
+            xmlElement = loc.find('AKA')
+            if xmlElement is not None:
+                self.novel.locations[lcId].aka = xmlElement.text
 
-                if loc.find('AKA') is not None:
-                    self.novel.locations[lcId].aka = loc.find('AKA').text
+            xmlElement = loc.find('Tags')
+            if xmlElement is not None:
+                if xmlElement.text is not None:
+                    tags = string_to_list(xmlElement.text)
+                    self.novel.locations[lcId].tags = self._strip_spaces(tags)
 
-                if loc.find('Tags') is not None:
-                    if loc.find('Tags').text is not None:
-                        tags = string_to_list(loc.find('Tags').text)
-                        self.novel.locations[lcId].tags = self._strip_spaces(tags)
+            #--- Initialize custom keyword variables.
+            for fieldName in self.LOC_KWVAR:
+                self.novel.locations[lcId].kwVar[fieldName] = None
 
-                #--- Initialize custom keyword variables.
+            #--- Read location custom fields.
+            for lcFields in loc.findall('Fields'):
                 for fieldName in self.LOC_KWVAR:
-                    self.novel.locations[lcId].kwVar[fieldName] = None
+                    field = lcFields.find(fieldName)
+                    if field is not None:
+                        self.novel.locations[lcId].kwVar[fieldName] = field.text
 
-                #--- Read location custom fields.
-                for lcFields in loc.findall('Fields'):
-                    for fieldName in self.LOC_KWVAR:
-                        field = lcFields.find(fieldName)
-                        if field is not None:
-                            self.novel.locations[lcId].kwVar[fieldName] = field.text
+        def read_item(itm):
+            #--- Read an item from the xml element tree.
+            itId = itm.find('ID').text
+            appendItId(itId)
+            self.novel.items[itId] = WorldElement()
 
-        def read_items(root):
-            #--- Read items from the xml element tree.
-            self.novel.srtItems = []
-            # This is necessary for re-reading.
-            for itm in root.iter('ITEM'):
-                itId = itm.find('ID').text
-                self.novel.srtItems.append(itId)
-                self.novel.items[itId] = WorldElement()
+            xmlElement = itm.find('Title')
+            if xmlElement is not None:
+                self.novel.items[itId].title = xmlElement.text
 
-                if itm.find('Title') is not None:
-                    self.novel.items[itId].title = itm.find('Title').text
+            xmlElement = itm.find('ImageFile')
+            if xmlElement is not None:
+                self.novel.items[itId].image = xmlElement.text
 
-                if itm.find('ImageFile') is not None:
-                    self.novel.items[itId].image = itm.find('ImageFile').text
+            xmlElement = itm.find('Desc')
+            if xmlElement is not None:
+                self.novel.items[itId].desc = xmlElement.text
 
-                if itm.find('Desc') is not None:
-                    self.novel.items[itId].desc = itm.find('Desc').text
+            xmlElement = itm.find('AKA')
+            if xmlElement is not None:
+                self.novel.items[itId].aka = xmlElement.text
 
-                if itm.find('AKA') is not None:
-                    self.novel.items[itId].aka = itm.find('AKA').text
+            xmlElement = itm.find('Tags')
+            if xmlElement is not None:
+                if xmlElement.text is not None:
+                    tags = string_to_list(xmlElement.text)
+                    self.novel.items[itId].tags = self._strip_spaces(tags)
 
-                if itm.find('Tags') is not None:
-                    if itm.find('Tags').text is not None:
-                        tags = string_to_list(itm.find('Tags').text)
-                        self.novel.items[itId].tags = self._strip_spaces(tags)
+            #--- Initialize custom keyword variables.
+            for fieldName in self.ITM_KWVAR:
+                self.novel.items[itId].kwVar[fieldName] = None
 
-                #--- Initialize custom keyword variables.
+            #--- Read item custom fields.
+            for itFields in itm.findall('Fields'):
                 for fieldName in self.ITM_KWVAR:
-                    self.novel.items[itId].kwVar[fieldName] = None
-
-                #--- Read item custom fields.
-                for itFields in itm.findall('Fields'):
-                    for fieldName in self.ITM_KWVAR:
-                        field = itFields.find(fieldName)
-                        if field is not None:
-                            self.novel.items[itId].kwVar[fieldName] = field.text
-
-        def read_characters(root):
-            #--- Read characters from the xml element tree.
-            self.novel.srtCharacters = []
-            # This is necessary for re-reading.
-            for crt in root.iter('CHARACTER'):
-                crId = crt.find('ID').text
-                self.novel.srtCharacters.append(crId)
-                self.novel.characters[crId] = Character()
-
-                if crt.find('Title') is not None:
-                    self.novel.characters[crId].title = crt.find('Title').text
-
-                if crt.find('ImageFile') is not None:
-                    self.novel.characters[crId].image = crt.find('ImageFile').text
-
-                if crt.find('Desc') is not None:
-                    self.novel.characters[crId].desc = crt.find('Desc').text
-
-                if crt.find('AKA') is not None:
-                    self.novel.characters[crId].aka = crt.find('AKA').text
-
-                if crt.find('Tags') is not None:
-                    if crt.find('Tags').text is not None:
-                        tags = string_to_list(crt.find('Tags').text)
-                        self.novel.characters[crId].tags = self._strip_spaces(tags)
-
-                if crt.find('Notes') is not None:
-                    self.novel.characters[crId].notes = crt.find('Notes').text
-
-                if crt.find('Bio') is not None:
-                    self.novel.characters[crId].bio = crt.find('Bio').text
-
-                if crt.find('Goals') is not None:
-                    self.novel.characters[crId].goals = crt.find('Goals').text
-
-                if crt.find('FullName') is not None:
-                    self.novel.characters[crId].fullName = crt.find('FullName').text
+                    field = itFields.find(fieldName)
+                    if field is not None:
+                        self.novel.items[itId].kwVar[fieldName] = field.text
+
+        def read_character(crt):
+            #--- Read a character from the xml element tree.
+            crId = crt.find('ID').text
+            appendCrId(crId)
+            self.novel.characters[crId] = Character()
+
+            xmlElement = crt.find('Title')
+            if xmlElement is not None:
+                self.novel.characters[crId].title = xmlElement.text
+
+            xmlElement = crt.find('ImageFile')
+            if xmlElement is not None:
+                self.novel.characters[crId].image = xmlElement.text
+
+            xmlElement = crt.find('Desc')
+            if xmlElement is not None:
+                self.novel.characters[crId].desc = xmlElement.text
+
+            xmlElement = crt.find('AKA')
+            if xmlElement is not None:
+                self.novel.characters[crId].aka = xmlElement.text
+
+            xmlElement = crt.find('Tags')
+            if xmlElement is not None:
+                if xmlElement.text is not None:
+                    tags = string_to_list(xmlElement.text)
+                    self.novel.characters[crId].tags = self._strip_spaces(tags)
+
+            xmlElement = crt.find('Notes')
+            if xmlElement is not None:
+                self.novel.characters[crId].notes = xmlElement.text
+
+            xmlElement = crt.find('Bio')
+            if xmlElement is not None:
+                self.novel.characters[crId].bio = xmlElement.text
+
+            xmlElement = crt.find('Goals')
+            if xmlElement is not None:
+                self.novel.characters[crId].goals = xmlElement.text
+
+            xmlElement = crt.find('FullName')
+            if xmlElement is not None:
+                self.novel.characters[crId].fullName = xmlElement.text
+
+            if crt.find('Major') is not None:
+                self.novel.characters[crId].isMajor = True
+            else:
+                self.novel.characters[crId].isMajor = False
 
-                if crt.find('Major') is not None:
-                    self.novel.characters[crId].isMajor = True
-                else:
-                    self.novel.characters[crId].isMajor = False
+            #--- Initialize custom keyword variables.
+            for fieldName in self.CRT_KWVAR:
+                self.novel.characters[crId].kwVar[fieldName] = None
 
-                #--- Initialize custom keyword variables.
+            #--- Read character custom fields.
+            for crFields in crt.findall('Fields'):
                 for fieldName in self.CRT_KWVAR:
-                    self.novel.characters[crId].kwVar[fieldName] = None
-
-                #--- Read character custom fields.
-                for crFields in crt.findall('Fields'):
-                    for fieldName in self.CRT_KWVAR:
-                        field = crFields.find(fieldName)
-                        if field is not None:
-                            self.novel.characters[crId].kwVar[fieldName] = field.text
+                    field = crFields.find(fieldName)
+                    if field is not None:
+                        self.novel.characters[crId].kwVar[fieldName] = field.text
 
-        def read_projectnotes(root):
+        def read_projectnotes(pnts):
             #--- Read project notes from the xml element tree.
-            self.novel.srtPrjNotes = []
-            # This is necessary for re-reading.
-
             try:
-                for pnt in root.find('PROJECTNOTES'):
-                    if pnt.find('ID') is not None:
-                        pnId = pnt.find('ID').text
-                        self.novel.srtPrjNotes.append(pnId)
+                for pnt in pnts:
+                    xmlElement = pnt.find('ID')
+                    if xmlElement is not None:
+                        pnId = xmlElement.text
+                        appendPnId(pnId)
                         self.novel.projectNotes[pnId] = BasicElement()
-                        if pnt.find('Title') is not None:
-                            self.novel.projectNotes[pnId].title = pnt.find('Title').text
-                        if pnt.find('Desc') is not None:
-                            self.novel.projectNotes[pnId].desc = pnt.find('Desc').text
+                        xmlElement = pnt.find('Title')
+                        if xmlElement is not None:
+                            self.novel.projectNotes[pnId].title = xmlElement.text
+                        xmlElement = pnt.find('Desc')
+                        if xmlElement is not None:
+                            self.novel.projectNotes[pnId].desc = xmlElement.text
 
                     #--- Initialize project note custom fields.
                     for fieldName in self.PNT_KWVAR:
@@ -294,19 +331,22 @@ class Yw7File(File):
             except:
                 pass
 
-        def read_projectvars(root):
+        def read_projectvars(pvars):
             #--- Read relevant project variables from the xml element tree.
             try:
-                for projectvar in root.find('PROJECTVARS'):
-                    if projectvar.find('Title') is not None:
-                        title = projectvar.find('Title').text
+                for projectvar in pvars:
+                    xmlElement = projectvar.find('Title')
+                    if xmlElement is not None:
+                        title = xmlElement.text
                         if title == 'Language':
-                            if projectvar.find('Desc') is not None:
-                                self.novel.languageCode = projectvar.find('Desc').text
+                            xmlElement = projectvar.find('Desc')
+                            if xmlElement is not None:
+                                self.novel.languageCode = xmlElement.text
 
                         elif title == 'Country':
-                            if projectvar.find('Desc') is not None:
-                                self.novel.countryCode = projectvar.find('Desc').text
+                            xmlElement = projectvar.find('Desc')
+                            if xmlElement is not None:
+                                self.novel.countryCode = xmlElement.text
 
                         elif title.startswith('lang='):
                             try:
@@ -319,282 +359,304 @@ class Yw7File(File):
             except:
                 pass
 
-        def read_scenes(root):
+        def read_scene(scn):
             """ Read attributes at scene level from the xml element tree."""
-            for scn in root.iter('SCENE'):
-                scId = scn.find('ID').text
-                self.novel.scenes[scId] = Scene()
+            scId = scn.find('ID').text
+            self.novel.scenes[scId] = Scene()
 
-                if scn.find('Title') is not None:
-                    self.novel.scenes[scId].title = scn.find('Title').text
+            xmlElement = scn.find('Title')
+            if xmlElement is not None:
+                self.novel.scenes[scId].title = xmlElement.text
 
-                if scn.find('Desc') is not None:
-                    self.novel.scenes[scId].desc = scn.find('Desc').text
+            xmlElement = scn.find('Desc')
+            if xmlElement is not None:
+                self.novel.scenes[scId].desc = xmlElement.text
 
-                if scn.find('SceneContent') is not None:
-                    sceneContent = scn.find('SceneContent').text
-                    if sceneContent is not None:
-                        self.novel.scenes[scId].sceneContent = sceneContent
+            xmlElement = scn.find('SceneContent')
+            if xmlElement is not None:
+                sceneContent = xmlElement.text
+                if sceneContent is not None:
+                    self.novel.scenes[scId].sceneContent = sceneContent
 
-                #--- Read scene type.
+            #--- Read scene type.
 
-                # This is how yWriter 7.1.3.0 reads the scene type:
-                #
-                # Type   |<Unused>|Field_SceneType>|scType
-                #--------+--------+----------------+------
-                # Notes  | x      | 1              | 1
-                # Todo   | x      | 2              | 2
-                # Unused | -1     | N/A            | 3
-                # Unused | -1     | 0              | 3
-                # Normal | N/A    | N/A            | 0
-                # Normal | N/A    | 0              | 0
+            # This is how yWriter 7.1.3.0 reads the scene type:
+            #
+            # Type   |<Unused>|Field_SceneType>|scType
+            #--------+--------+----------------+------
+            # Notes  | x      | 1              | 1
+            # Todo   | x      | 2              | 2
+            # Unused | -1     | N/A            | 3
+            # Unused | -1     | 0              | 3
+            # Normal | N/A    | N/A            | 0
+            # Normal | N/A    | 0              | 0
+
+            self.novel.scenes[scId].scType = 0
 
-                self.novel.scenes[scId].scType = 0
+            #--- Initialize custom keyword variables.
+            for fieldName in self.SCN_KWVAR:
+                self.novel.scenes[scId].kwVar[fieldName] = None
 
-                #--- Initialize custom keyword variables.
+            for scFields in scn.findall('Fields'):
+                #--- Read scene custom fields.
                 for fieldName in self.SCN_KWVAR:
-                    self.novel.scenes[scId].kwVar[fieldName] = None
+                    field = scFields.find(fieldName)
+                    if field is not None:
+                        self.novel.scenes[scId].kwVar[fieldName] = field.text
+
+                # Read scene type, if any.
+                xmlElement = scFields.find('Field_SceneType')
+                if xmlElement is not None:
+                    if xmlElement.text == '1':
+                        self.novel.scenes[scId].scType = 1
+                    elif xmlElement.text == '2':
+                        self.novel.scenes[scId].scType = 2
+            if scn.find('Unused') is not None:
+                if self.novel.scenes[scId].scType == 0:
+                    self.novel.scenes[scId].scType = 3
+
+            # Export when RTF.
+            if scn.find('ExportCondSpecific') is None:
+                self.novel.scenes[scId].doNotExport = False
+            elif scn.find('ExportWhenRTF') is not None:
+                self.novel.scenes[scId].doNotExport = False
+            else:
+                self.novel.scenes[scId].doNotExport = True
 
-                for scFields in scn.findall('Fields'):
-                    #--- Read scene custom fields.
-                    for fieldName in self.SCN_KWVAR:
-                        field = scFields.find(fieldName)
-                        if field is not None:
-                            self.novel.scenes[scId].kwVar[fieldName] = field.text
-
-                    # Read scene type, if any.
-                    if scFields.find('Field_SceneType') is not None:
-                        if scFields.find('Field_SceneType').text == '1':
-                            self.novel.scenes[scId].scType = 1
-                        elif scFields.find('Field_SceneType').text == '2':
-                            self.novel.scenes[scId].scType = 2
-                if scn.find('Unused') is not None:
-                    if self.novel.scenes[scId].scType == 0:
-                        self.novel.scenes[scId].scType = 3
-
-                # Export when RTF.
-                if scn.find('ExportCondSpecific') is None:
-                    self.novel.scenes[scId].doNotExport = False
-                elif scn.find('ExportWhenRTF') is not None:
-                    self.novel.scenes[scId].doNotExport = False
-                else:
-                    self.novel.scenes[scId].doNotExport = True
+            xmlElement = scn.find('Status')
+            if xmlElement is not None:
+                self.novel.scenes[scId].status = int(xmlElement.text)
 
-                if scn.find('Status') is not None:
-                    self.novel.scenes[scId].status = int(scn.find('Status').text)
+            xmlElement = scn.find('Notes')
+            if xmlElement is not None:
+                self.novel.scenes[scId].notes = xmlElement.text
 
-                if scn.find('Notes') is not None:
-                    self.novel.scenes[scId].notes = scn.find('Notes').text
+            xmlElement = scn.find('Tags')
+            if xmlElement is not None:
+                if xmlElement.text is not None:
+                    tags = string_to_list(xmlElement.text)
+                    self.novel.scenes[scId].tags = self._strip_spaces(tags)
 
-                if scn.find('Tags') is not None:
-                    if scn.find('Tags').text is not None:
-                        tags = string_to_list(scn.find('Tags').text)
-                        self.novel.scenes[scId].tags = self._strip_spaces(tags)
+            xmlElement = scn.find('Field1')
+            if xmlElement is not None and xmlElement.text is not None:
+                self.novel.scenes[scId].field1 = sys.intern(xmlElement.text)
 
-                if scn.find('Field1') is not None:
-                    self.novel.scenes[scId].field1 = scn.find('Field1').text
+            xmlElement = scn.find('Field2')
+            if xmlElement is not None and xmlElement.text is not None:
+                self.novel.scenes[scId].field2 = sys.intern(xmlElement.text)
 
-                if scn.find('Field2') is not None:
-                    self.novel.scenes[scId].field2 = scn.find('Field2').text
+            xmlElement = scn.find('Field3')
+            if xmlElement is not None and xmlElement.text is not None:
+                self.novel.scenes[scId].field3 = sys.intern(xmlElement.text)
 
-                if scn.find('Field3') is not None:
-                    self.novel.scenes[scId].field3 = scn.find('Field3').text
+            xmlElement = scn.find('Field4')
+            if xmlElement is not None and xmlElement.text is not None:
+                self.novel.scenes[scId].field4 = sys.intern(xmlElement.text)
 
-                if scn.find('Field4') is not None:
-                    self.novel.scenes[scId].field4 = scn.find('Field4').text
+            if scn.find('AppendToPrev') is not None:
+                self.novel.scenes[scId].appendToPrev = True
+            else:
+                self.novel.scenes[scId].appendToPrev = False
 
-                if scn.find('AppendToPrev') is not None:
-                    self.novel.scenes[scId].appendToPrev = True
-                else:
-                    self.novel.scenes[scId].appendToPrev = False
+            #--- Scene start.
+            xmlElement = scn.find('SpecificDateTime')
+            if xmlElement is not None:
+                dateTimeStr = xmlElement.text
 
-                #--- Scene start.
-                if scn.find('SpecificDateTime') is not None:
-                    dateTimeStr = scn.find('SpecificDateTime').text
+                # Check SpecificDateTime for ISO compliance.
+                try:
+                    dateTime = datetime.fromisoformat(dateTimeStr)
+                except:
+                    self.novel.scenes[scId].date = ''
+                    self.novel.scenes[scId].time = ''
+                else:
+                    startDateTime = dateTime.isoformat().split('T')
+                    self.novel.scenes[scId].date = startDateTime[0]
+                    self.novel.scenes[scId].time = startDateTime[1]
+            else:
+                xmlElement = scn.find('Day')
+                if xmlElement is not None:
+                    day = xmlElement.text
 
-                    # Check SpecificDateTime for ISO compliance.
+                    # Check if Day represents an integer.
                     try:
-                        dateTime = datetime.fromisoformat(dateTimeStr)
-                    except:
-                        self.novel.scenes[scId].date = ''
-                        self.novel.scenes[scId].time = ''
-                    else:
-                        startDateTime = dateTime.isoformat().split('T')
-                        self.novel.scenes[scId].date = startDateTime[0]
-                        self.novel.scenes[scId].time = startDateTime[1]
+                        int(day)
+                    except ValueError:
+                        day = ''
+                    self.novel.scenes[scId].day = sys.intern(day)
+
+                hasUnspecificTime = False
+                xmlElement = scn.find('Hour')
+                if xmlElement is not None:
+                    hour = xmlElement.text.zfill(2)
+                    hasUnspecificTime = True
                 else:
-                    if scn.find('Day') is not None:
-                        day = scn.find('Day').text
-
-                        # Check if Day represents an integer.
-                        try:
-                            int(day)
-                        except ValueError:
-                            day = ''
-                        self.novel.scenes[scId].day = day
-
-                    hasUnspecificTime = False
-                    if scn.find('Hour') is not None:
-                        hour = scn.find('Hour').text.zfill(2)
-                        hasUnspecificTime = True
-                    else:
-                        hour = '00'
-                    if scn.find('Minute') is not None:
-                        minute = scn.find('Minute').text.zfill(2)
-                        hasUnspecificTime = True
-                    else:
-                        minute = '00'
-                    if hasUnspecificTime:
-                        self.novel.scenes[scId].time = f'{hour}:{minute}:00'
-
-                #--- Scene duration.
-                if scn.find('LastsDays') is not None:
-                    self.novel.scenes[scId].lastsDays = scn.find('LastsDays').text
-
-                if scn.find('LastsHours') is not None:
-                    self.novel.scenes[scId].lastsHours = scn.find('LastsHours').text
-
-                if scn.find('LastsMinutes') is not None:
-                    self.novel.scenes[scId].lastsMinutes = scn.find('LastsMinutes').text
-
-                if scn.find('ReactionScene') is not None:
-                    self.novel.scenes[scId].isReactionScene = True
+                    hour = '00'
+                xmlElement = scn.find('Minute')
+                if xmlElement is not None:
+                    minute = xmlElement.text.zfill(2)
+                    hasUnspecificTime = True
                 else:
-                    self.novel.scenes[scId].isReactionScene = False
+                    minute = '00'
+                if hasUnspecificTime:
+                    self.novel.scenes[scId].time = f'{hour}:{minute}:00'
 
-                if scn.find('SubPlot') is not None:
-                    self.novel.scenes[scId].isSubPlot = True
-                else:
-                    self.novel.scenes[scId].isSubPlot = False
-
-                if scn.find('Goal') is not None:
-                    self.novel.scenes[scId].goal = scn.find('Goal').text
-
-                if scn.find('Conflict') is not None:
-                    self.novel.scenes[scId].conflict = scn.find('Conflict').text
-
-                if scn.find('Outcome') is not None:
-                    self.novel.scenes[scId].outcome = scn.find('Outcome').text
-
-                if scn.find('ImageFile') is not None:
-                    self.novel.scenes[scId].image = scn.find('ImageFile').text
-
-                if scn.find('Characters') is not None:
-                    for characters in scn.find('Characters').iter('CharID'):
-                        crId = characters.text
-                        if crId in self.novel.srtCharacters:
-                            if self.novel.scenes[scId].characters is None:
-                                self.novel.scenes[scId].characters = []
-                            self.novel.scenes[scId].characters.append(crId)
-
-                if scn.find('Locations') is not None:
-                    for locations in scn.find('Locations').iter('LocID'):
-                        lcId = locations.text
-                        if lcId in self.novel.srtLocations:
-                            if self.novel.scenes[scId].locations is None:
-                                self.novel.scenes[scId].locations = []
-                            self.novel.scenes[scId].locations.append(lcId)
-
-                if scn.find('Items') is not None:
-                    for items in scn.find('Items').iter('ItemID'):
-                        itId = items.text
-                        if itId in self.novel.srtItems:
-                            if self.novel.scenes[scId].items is None:
-                                self.novel.scenes[scId].items = []
-                            self.novel.scenes[scId].items.append(itId)
-
-        def read_chapters(root):
-            #--- Read attributes at chapter level from the xml element tree.
-            self.novel.srtChapters = []
-            # This is necessary for re-reading.
-            for chp in root.iter('CHAPTER'):
-                chId = chp.find('ID').text
-                self.novel.chapters[chId] = Chapter()
-                self.novel.srtChapters.append(chId)
-
-                if chp.find('Title') is not None:
-                    self.novel.chapters[chId].title = chp.find('Title').text
-
-                if chp.find('Desc') is not None:
-                    self.novel.chapters[chId].desc = chp.find('Desc').text
-
-                if chp.find('SectionStart') is not None:
-                    self.novel.chapters[chId].chLevel = 1
-                else:
-                    self.novel.chapters[chId].chLevel = 0
-
-                # This is how yWriter 7.1.3.0 reads the chapter type:
-                #
-                # Type   |<Unused>|<Type>|<ChapterType>|chType
-                # -------+--------+------+--------------------
-                # Normal | N/A    | N/A  | N/A         | 0
-                # Normal | N/A    | 0    | N/A         | 0
-                # Notes  | x      | 1    | N/A         | 1
-                # Unused | -1     | 0    | N/A         | 3
-                # Normal | N/A    | x    | 0           | 0
-                # Notes  | x      | x    | 1           | 1
-                # Todo   | x      | x    | 2           | 2
-                # Unused | -1     | x    | x           | 3
-
-                self.novel.chapters[chId].chType = 0
-                if chp.find('Unused') is not None:
-                    yUnused = True
-                else:
-                    yUnused = False
-                if chp.find('ChapterType') is not None:
-                    # The file may be created with yWriter version 7.0.7.2+
-                    yChapterType = chp.find('ChapterType').text
-                    if yChapterType == '2':
-                        self.novel.chapters[chId].chType = 2
-                    elif yChapterType == '1':
+            #--- Scene duration.
+            xmlElement = scn.find('LastsDays')
+            if xmlElement is not None and xmlElement.text is not None:
+                self.novel.scenes[scId].lastsDays = sys.intern(xmlElement.text)
+
+            xmlElement = scn.find('LastsHours')
+            if xmlElement is not None and xmlElement.text is not None:
+                self.novel.scenes[scId].lastsHours = sys.intern(xmlElement.text)
+
+            xmlElement = scn.find('LastsMinutes')
+            if xmlElement is not None and xmlElement.text is not None:
+                self.novel.scenes[scId].lastsMinutes = sys.intern(xmlElement.text)
+
+            if scn.find('ReactionScene') is not None:
+                self.novel.scenes[scId].isReactionScene = True
+            else:
+                self.novel.scenes[scId].isReactionScene = False
+
+            if scn.find('SubPlot') is not None:
+                self.novel.scenes[scId].isSubPlot = True
+            else:
+                self.novel.scenes[scId].isSubPlot = False
+
+            xmlElement = scn.find('Goal')
+            if xmlElement is not None:
+                self.novel.scenes[scId].goal = xmlElement.text
+
+            xmlElement = scn.find('Conflict')
+            if xmlElement is not None:
+                self.novel.scenes[scId].conflict = xmlElement.text
+
+            xmlElement = scn.find('Outcome')
+            if xmlElement is not None:
+                self.novel.scenes[scId].outcome = xmlElement.text
+
+            xmlElement = scn.find('ImageFile')
+            if xmlElement is not None:
+                self.novel.scenes[scId].image = xmlElement.text
+
+            #--- Scene references: one pass over the scene's children
+            # instead of searching the subtree per container.
+            for xmlRefs in scn:
+                tag = xmlRefs.tag
+                if tag == 'Characters':
+                    crIds = [xmlId.text for xmlId in xmlRefs.iter('CharID')
+                             if xmlId.text in self.novel.characters]
+                    if crIds:
+                        self.novel.scenes[scId].characters = crIds
+                elif tag == 'Locations':
+                    lcIds = [xmlId.text for xmlId in xmlRefs.iter('LocID')
+                             if xmlId.text in self.novel.locations]
+                    if lcIds:
+                        self.novel.scenes[scId].locations = lcIds
+                elif tag == 'Items':
+                    itIds = [xmlId.text for xmlId in xmlRefs.iter('ItemID')
+                             if xmlId.text in self.novel.items]
+                    if itIds:
+                        self.novel.scenes[scId].items = itIds
+
+        def read_chapter(chp):
+            #--- Read a chapter from the xml element tree.
+            chId = chp.find('ID').text
+            self.novel.chapters[chId] = Chapter()
+            appendChId(chId)
+
+            xmlElement = chp.find('Title')
+            if xmlElement is not None:
+                self.novel.chapters[chId].title = xmlElement.text
+
+            xmlElement = chp.find('Desc')
+            if xmlElement is not None:
+                self.novel.chapters[chId].desc = xmlElement.text
+
+            if chp.find('SectionStart') is not None:
+                self.novel.chapters[chId].chLevel = 1
+            else:
+                self.novel.chapters[chId].chLevel = 0
+
+            # This is how yWriter 7.1.3.0 reads the chapter type:
+            #
+            # Type   |<Unused>|<Type>|<ChapterType>|chType
+            # -------+--------+------+--------------------
+            # Normal | N/A    | N/A  | N/A         | 0
+            # Normal | N/A    | 0    | N/A         | 0
+            # Notes  | x      | 1    | N/A         | 1
+            # Unused | -1     | 0    | N/A         | 3
+            # Normal | N/A    | x    | 0           | 0
+            # Notes  | x      | x    | 1           | 1
+            # Todo   | x      | x    | 2           | 2
+            # Unused | -1     | x    | x           | 3
+
+            self.novel.chapters[chId].chType = 0
+            if chp.find('Unused') is not None:
+                yUnused = True
+            else:
+                yUnused = False
+            xmlElement = chp.find('ChapterType')
+            if xmlElement is not None:
+                # The file may be created with yWriter version 7.0.7.2+
+                yChapterType = xmlElement.text
+                if yChapterType == '2':
+                    self.novel.chapters[chId].chType = 2
+                elif yChapterType == '1':
+                    self.novel.chapters[chId].chType = 1
+                elif yUnused:
+                    self.novel.chapters[chId].chType = 3
+            else:
+                # The file may be created with a yWriter version prior to 7.0.7.2
+                xmlElement = chp.find('Type')
+                if xmlElement is not None:
+                    yType = xmlElement.text
+                    if yType == '1':
                         self.novel.chapters[chId].chType = 1
                     elif yUnused:
                         self.novel.chapters[chId].chType = 3
-                else:
-                    # The file may be created with a yWriter version prior to 7.0.7.2
-                    if chp.find('Type') is not None:
-                        yType = chp.find('Type').text
-                        if yType == '1':
-                            self.novel.chapters[chId].chType = 1
-                        elif yUnused:
-                            self.novel.chapters[chId].chType = 3
-
-                self.novel.chapters[chId].suppressChapterTitle = False
-                if self.novel.chapters[chId].title is not None:
-                    if self.novel.chapters[chId].title.startswith('@'):
-                        self.novel.chapters[chId].suppressChapterTitle = True
 
-                #--- Initialize custom keyword variables.
-                for fieldName in self.CHP_KWVAR:
-                    self.novel.chapters[chId].kwVar[fieldName] = None
-
-                #--- Read chapter fields.
-                for chFields in chp.findall('Fields'):
-                    if chFields.find('Field_SuppressChapterTitle') is not None:
-                        if chFields.find('Field_SuppressChapterTitle').text == '1':
-                            self.novel.chapters[chId].suppressChapterTitle = True
-                    self.novel.chapters[chId].isTrash = False
-                    if chFields.find('Field_IsTrash') is not None:
-                        if chFields.find('Field_IsTrash').text == '1':
-                            self.novel.chapters[chId].isTrash = True
-                    self.novel.chapters[chId].suppressChapterBreak = False
-                    if chFields.find('Field_SuppressChapterBreak') is not None:
-                        if chFields.find('Field_SuppressChapterBreak').text == '1':
-                            self.novel.chapters[chId].suppressChapterBreak = True
-
-                    #--- Read chapter custom fields.
-                    for fieldName in self.CHP_KWVAR:
-                        field = chFields.find(fieldName)
-                        if field is not None:
-                            self.novel.chapters[chId].kwVar[fieldName] = field.text
+            self.novel.chapters[chId].suppressChapterTitle = False
+            if self.novel.chapters[chId].title is not None:
+                if self.novel.chapters[chId].title.startswith('@'):
+                    self.novel.chapters[chId].suppressChapterTitle = True
 
-                #--- Read chapter's scene list.
+            #--- Initialize custom keyword variables.
+            for fieldName in self.CHP_KWVAR:
+                self.novel.chapters[chId].kwVar[fieldName] = None
+
+            #--- Read chapter fields.
+            for chFields in chp.findall('Fields'):
+                xmlElement = chFields.find('Field_SuppressChapterTitle')
+                if xmlElement is not None:
+                    if xmlElement.text == '1':
+                        self.novel.chapters[chId].suppressChapterTitle = True
+                self.novel.chapters[chId].isTrash = False
+                xmlElement = chFields.find('Field_IsTrash')
+                if xmlElement is not None:
+                    if xmlElement.text == '1':
+                        self.novel.chapters[chId].isTrash = True
+                self.novel.chapters[chId].suppressChapterBreak = False
+                xmlElement = chFields.find('Field_SuppressChapterBreak')
+                if xmlElement is not None:
+                    if xmlElement.text == '1':
+                        self.novel.chapters[chId].suppressChapterBreak = True
+
+                #--- Read chapter custom fields.
+                for fieldName in self.CHP_KWVAR:
+                    field = chFields.find(fieldName)
+                    if field is not None:
+                        self.novel.chapters[chId].kwVar[fieldName] = field.text
+
+            #--- Read chapter's scene list.
+            xmlElement = chp.find('Scenes')
+            if xmlElement is not None:
+                self.novel.chapters[chId].srtScenes = [
+                    scn.text for scn in xmlElement.findall('ScID')
+                    if scn.text in self.novel.scenes]
+            else:
                 self.novel.chapters[chId].srtScenes = []
-                if chp.find('Scenes') is not None:
-                    for scn in chp.find('Scenes').findall('ScID'):
-                        scId = scn.text
-                        if scId in self.novel.scenes:
-                            self.novel.chapters[chId].srtScenes.append(scId)
 
         #--- Begin reading.
         for field in self.PRJ_KWVAR:
@@ -602,20 +664,57 @@ class Yw7File(File):
 
         if self.is_locked():
             raise Error(f'{_("yWriter seems to be open. Please close first")}.')
+
+        self.novel.srtLocations = []
+        self.novel.srtItems = []
+        self.novel.srtCharacters = []
+        self.novel.srtPrjNotes = []
+        self.novel.srtChapters = []
+        # This is necessary for re-reading.
+
+        appendLcId = self.novel.srtLocations.append
+        appendItId = self.novel.srtItems.append
+        appendCrId = self.novel.srtCharacters.append
+        appendPnId = self.novel.srtPrjNotes.append
+        appendChId = self.novel.srtChapters.append
+        # Bound append methods for the record readers.
+
+        #--- Parse the file, dispatching the records in a single pass.
+        # Scenes and chapters are processed after the pass, so their
+        # cross references do not depend on the order of the sections.
+        xmlScenes = []
+        xmlChapters = []
         try:
-            self.tree = ET.parse(self.filePath)
+            xmlIter = ET.iterparse(self.filePath, events=('end',))
+            for __, xmlRecord in xmlIter:
+                tag = xmlRecord.tag
+                if tag == 'SCENE':
+                    xmlScenes.append(xmlRecord)
+                elif tag == 'CHAPTER':
+                    xmlChapters.append(xmlRecord)
+                elif tag == 'LOCATION':
+                    read_location(xmlRecord)
+                elif tag == 'ITEM':
+                    read_item(xmlRecord)
+                elif tag == 'CHARACTER':
+                    read_character(xmlRecord)
+                elif tag == 'PROJECT':
+                    read_project(xmlRecord)
+                elif tag == 'PROJECTVARS':
+                    read_projectvars(xmlRecord)
+                elif tag == 'PROJECTNOTES':
+                    read_projectnotes(xmlRecord)
+        except Error:
+            raise
         except:
             raise Error(f'{_("Can not process file")}: "{norm_path(self.filePath)}".')
 
-        root = self.tree.getroot()
-        read_project(root)
-        read_locations(root)
-        read_items(root)
-        read_characters(root)
-        read_projectvars(root)
-        read_projectnotes(root)
-        read_scenes(root)
-        read_chapters(root)
+        self.tree = ET.ElementTree(xmlIter.root)
+        # The whole tree is kept for writing back.
+        for scn in xmlScenes:
+            read_scene(scn)
+        for chp in xmlChapters:
+            read_chapter(chp)
         self.adjust_scene_types()
 
         #--- Set custom instance variables.
@@ -638,15 +737,14 @@ class Yw7File(File):
             self.novel.get_languages()
 
         #--- Get custom instance variables.
-        for scId in self.novel.scenes:
-            if self.novel.scenes[scId].scnArcs is not None:
-                self.novel.scenes[scId].kwVar['Field_SceneArcs'] = self.novel.scenes[scId].scnArcs
-            if self.novel.scenes[scId].scnStyle is not None:
-                self.novel.scenes[scId].kwVar['Field_SceneStyle'] = self.novel.scenes[scId].scnStyle
+        for prjScn in self.novel.scenes.values():
+            if prjScn.scnArcs is not None:
+                prjScn.kwVar['Field_SceneArcs'] = prjScn.scnArcs
+            if prjScn.scnStyle is not None:
+                prjScn.kwVar['Field_SceneStyle'] = prjScn.scnStyle
 
         self._build_element_tree()
         self._write_element_tree(self)
-        self._postprocess_xml_file(self.filePath)
 
     def is_locked(self):
         """Check whether the yw7 file is locked by yWriter.
@@ -658,6 +756,24 @@ class Yw7File(File):
 
     def _build_element_tree(self):
         """Modify the yWriter project attributes of an existing xml element tree."""
+        SubElement = ET.SubElement
+        # Bound as a local; this method calls it once per XML element.
+
+        def add_id_children(parent, tag, elemIds):
+            #--- Append one ID child element per list entry to parent.
+            for elemId in elemIds:
+                SubElement(parent, tag).text = elemId
+
+        def set_optional_element(parent, tag, text):
+            #--- Update an existing element, or create it if text is not empty.
+            if text is None:
+                return
+
+            xmlField = parent.find(tag)
+            if xmlField is not None:
+                xmlField.text = text
+            elif text:
+                SubElement(parent, tag).text = text
 
         def set_element(parent, tag, text, index):
             subelement = parent.find(tag)
@@ -695,26 +811,20 @@ class Yw7File(File):
             i = set_element(xmlScn, 'Title', prjScn.title, i)
 
             if xmlScn.find('BelongsToChID') is None:
-                for chId in self.novel.chapters:
-                    if scId in self.novel.chapters[chId].srtScenes:
-                        ET.SubElement(xmlScn, 'BelongsToChID').text = chId
-                        break
+                chId = sceneToChapter.get(scId)
+                if chId is not None:
+                    SubElement(xmlScn, 'BelongsToChID').text = chId
 
-            if prjScn.desc is not None:
-                try:
-                    xmlScn.find('Desc').text = prjScn.desc
-                except(AttributeError):
-                    if prjScn.desc:
-                        ET.SubElement(xmlScn, 'Desc').text = prjScn.desc
+            set_optional_element(xmlScn, 'Desc', prjScn.desc)
 
             if xmlScn.find('SceneContent') is None:
-                ET.SubElement(xmlScn, 'SceneContent').text = prjScn.sceneContent
+                SubElement(xmlScn, 'SceneContent').text = prjScn.sceneContent
 
             if xmlScn.find('WordCount') is None:
-                ET.SubElement(xmlScn, 'WordCount').text = str(prjScn.wordCount)
+                SubElement(xmlScn, 'WordCount').text = prjScn.wordCountStr
 
             if xmlScn.find('LetterCount') is None:
-                ET.SubElement(xmlScn, 'LetterCount').text = str(prjScn.letterCount)
+                SubElement(xmlScn, 'LetterCount').text = prjScn.letterCountStr
 
             #--- Write scene type.
             #
@@ -740,7 +850,7 @@ class Yw7File(File):
             # <Unused> (remove, if scene is "Normal").
             if yUnused:
                 if xmlScn.find('Unused') is None:
-                    ET.SubElement(xmlScn, 'Unused').text = '-1'
+                    SubElement(xmlScn, 'Unused').text = '-1'
             elif xmlScn.find('Unused') is not None:
                 xmlScn.remove(xmlScn.find('Unused'))
 
@@ -755,87 +865,51 @@ class Yw7File(File):
                     try:
                         fieldScType.text = ySceneType
                     except(AttributeError):
-                        ET.SubElement(scFields, 'Field_SceneType').text = ySceneType
+                        SubElement(scFields, 'Field_SceneType').text = ySceneType
             elif ySceneType is not None:
-                scFields = ET.SubElement(xmlScn, 'Fields')
-                ET.SubElement(scFields, 'Field_SceneType').text = ySceneType
+                scFields = SubElement(xmlScn, 'Fields')
+                SubElement(scFields, 'Field_SceneType').text = ySceneType
 
             #--- Write scene custom fields.
             for field in self.SCN_KWVAR:
-                if self.novel.scenes[scId].kwVar.get(field, None):
+                if prjScn.kwVar.get(field, None):
                     if scFields is None:
-                        scFields = ET.SubElement(xmlScn, 'Fields')
+                        scFields = SubElement(xmlScn, 'Fields')
                     try:
-                        scFields.find(field).text = self.novel.scenes[scId].kwVar[field]
+                        scFields.find(field).text = prjScn.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(scFields, field).text = self.novel.scenes[scId].kwVar[field]
+                        SubElement(scFields, field).text = prjScn.kwVar[field]
                 elif scFields is not None:
                     try:
                         scFields.remove(scFields.find(field))
                     except:
                         pass
 
+            # Remove an empty Fields element left behind.
+            if scFields is not None and not len(scFields):
+                xmlScn.remove(scFields)
+
             if prjScn.status is not None:
                 try:
                     xmlScn.find('Status').text = str(prjScn.status)
                 except:
-                    ET.SubElement(xmlScn, 'Status').text = str(prjScn.status)
+                    SubElement(xmlScn, 'Status').text = str(prjScn.status)
 
-            if prjScn.notes is not None:
-                try:
-                    xmlScn.find('Notes').text = prjScn.notes
-                except(AttributeError):
-                    if prjScn.notes:
-                        ET.SubElement(xmlScn, 'Notes').text = prjScn.notes
-
-            if prjScn.tags is not None:
-                try:
-                    xmlScn.find('Tags').text = list_to_string(prjScn.tags)
-                except(AttributeError):
-                    if prjScn.tags:
-                        ET.SubElement(xmlScn, 'Tags').text = list_to_string(prjScn.tags)
-
-            if prjScn.field1 is not None:
-                try:
-                    xmlScn.find('Field1').text = prjScn.field1
-                except(AttributeError):
-                    if prjScn.field1:
-                        ET.SubElement(xmlScn, 'Field1').text = prjScn.field1
-
-            if prjScn.field2 is not None:
-                try:
-                    xmlScn.find('Field2').text = prjScn.field2
-                except(AttributeError):
-                    if prjScn.field2:
-                        ET.SubElement(xmlScn, 'Field2').text = prjScn.field2
-
-            if prjScn.field3 is not None:
-                try:
-                    xmlScn.find('Field3').text = prjScn.field3
-                except(AttributeError):
-                    if prjScn.field3:
-                        ET.SubElement(xmlScn, 'Field3').text = prjScn.field3
-
-            if prjScn.field4 is not None:
-                try:
-                    xmlScn.find('Field4').text = prjScn.field4
-                except(AttributeError):
-                    if prjScn.field4:
-                        ET.SubElement(xmlScn, 'Field4').text = prjScn.field4
+            for attrName, tag in self._SCN_FIELDS:
+                set_optional_element(xmlScn, tag, getattr(prjScn, attrName))
 
             if prjScn.appendToPrev:
                 if xmlScn.find('AppendToPrev') is None:
-                    ET.SubElement(xmlScn, 'AppendToPrev').text = '-1'
+                    SubElement(xmlScn, 'AppendToPrev').text = '-1'
             elif xmlScn.find('AppendToPrev') is not None:
                 xmlScn.remove(xmlScn.find('AppendToPrev'))
 
             #--- Write scene start.
             if (prjScn.date is not None) and (prjScn.time is not None):
-                separator = ' '
-                dateTime = f'{prjScn.date}{separator}{prjScn.time}'
+                dateTime = f'{prjScn.date} {prjScn.time}'
 
                 # Remove scene start data from XML, if date and time are empty strings.
-                if dateTime == separator:
+                if dateTime == ' ':
                     remove_date_time()
 
                 elif xmlScn.find('SpecificDateTime') is not None:
@@ -843,8 +917,8 @@ class Yw7File(File):
                         dateTime = f'{dateTime}:00'
                     xmlScn.find('SpecificDateTime').text = dateTime
                 else:
-                    ET.SubElement(xmlScn, 'SpecificDateTime').text = dateTime
-                    ET.SubElement(xmlScn, 'SpecificDateMode').text = '-1'
+                    SubElement(xmlScn, 'SpecificDateTime').text = dateTime
+                    SubElement(xmlScn, 'SpecificDateMode').text = '-1'
 
                     if xmlScn.find('Day') is not None:
                         xmlScn.remove(xmlScn.find('Day'))
@@ -871,153 +945,73 @@ class Yw7File(File):
                         try:
                             xmlScn.find('Day').text = prjScn.day
                         except(AttributeError):
-                            ET.SubElement(xmlScn, 'Day').text = prjScn.day
+                            SubElement(xmlScn, 'Day').text = prjScn.day
                     if prjScn.time is not None:
                         hours, minutes, seconds = prjScn.time.split(':')
                         try:
                             xmlScn.find('Hour').text = hours
                         except(AttributeError):
-                            ET.SubElement(xmlScn, 'Hour').text = hours
+                            SubElement(xmlScn, 'Hour').text = hours
                         try:
                             xmlScn.find('Minute').text = minutes
                         except(AttributeError):
-                            ET.SubElement(xmlScn, 'Minute').text = minutes
+                            SubElement(xmlScn, 'Minute').text = minutes
 
             #--- Write scene duration.
-            if prjScn.lastsDays is not None:
-                try:
-                    xmlScn.find('LastsDays').text = prjScn.lastsDays
-                except(AttributeError):
-                    if prjScn.lastsDays:
-                        ET.SubElement(xmlScn, 'LastsDays').text = prjScn.lastsDays
-
-            if prjScn.lastsHours is not None:
-                try:
-                    xmlScn.find('LastsHours').text = prjScn.lastsHours
-                except(AttributeError):
-                    if prjScn.lastsHours:
-                        ET.SubElement(xmlScn, 'LastsHours').text = prjScn.lastsHours
-
-            if prjScn.lastsMinutes is not None:
-                try:
-                    xmlScn.find('LastsMinutes').text = prjScn.lastsMinutes
-                except(AttributeError):
-                    if prjScn.lastsMinutes:
-                        ET.SubElement(xmlScn, 'LastsMinutes').text = prjScn.lastsMinutes
+            for attrName, tag in self._SCN_DURATION_FIELDS:
+                set_optional_element(xmlScn, tag, getattr(prjScn, attrName))
 
             # Plot related information
             if prjScn.isReactionScene:
                 if xmlScn.find('ReactionScene') is None:
-                    ET.SubElement(xmlScn, 'ReactionScene').text = '-1'
+                    SubElement(xmlScn, 'ReactionScene').text = '-1'
             elif xmlScn.find('ReactionScene') is not None:
                 xmlScn.remove(xmlScn.find('ReactionScene'))
 
             if prjScn.isSubPlot:
                 if xmlScn.find('SubPlot') is None:
-                    ET.SubElement(xmlScn, 'SubPlot').text = '-1'
+                    SubElement(xmlScn, 'SubPlot').text = '-1'
             elif xmlScn.find('SubPlot') is not None:
                 xmlScn.remove(xmlScn.find('SubPlot'))
 
-            if prjScn.goal is not None:
-                try:
-                    xmlScn.find('Goal').text = prjScn.goal
-                except(AttributeError):
-                    if prjScn.goal:
-                        ET.SubElement(xmlScn, 'Goal').text = prjScn.goal
-
-            if prjScn.conflict is not None:
-                try:
-                    xmlScn.find('Conflict').text = prjScn.conflict
-                except(AttributeError):
-                    if prjScn.conflict:
-                        ET.SubElement(xmlScn, 'Conflict').text = prjScn.conflict
-
-            if prjScn.outcome is not None:
-                try:
-                    xmlScn.find('Outcome').text = prjScn.outcome
-                except(AttributeError):
-                    if prjScn.outcome:
-                        ET.SubElement(xmlScn, 'Outcome').text = prjScn.outcome
-
-            if prjScn.image is not None:
-                try:
-                    xmlScn.find('ImageFile').text = prjScn.image
-                except(AttributeError):
-                    if prjScn.image:
-                        ET.SubElement(xmlScn, 'ImageFile').text = prjScn.image
+            for attrName, tag in self._SCN_PLOT_FIELDS:
+                set_optional_element(xmlScn, tag, getattr(prjScn, attrName))
 
             #--- Characters/locations/items
-            if prjScn.characters is not None:
-                characters = xmlScn.find('Characters')
-                try:
-                    for oldCrId in characters.findall('CharID'):
-                        characters.remove(oldCrId)
-                except(AttributeError):
-                    characters = ET.SubElement(xmlScn, 'Characters')
-                for crId in prjScn.characters:
-                    ET.SubElement(characters, 'CharID').text = crId
-
-            if prjScn.locations is not None:
-                locations = xmlScn.find('Locations')
-                try:
-                    for oldLcId in locations.findall('LocID'):
-                        locations.remove(oldLcId)
-                except(AttributeError):
-                    locations = ET.SubElement(xmlScn, 'Locations')
-                for lcId in prjScn.locations:
-                    ET.SubElement(locations, 'LocID').text = lcId
-
-            if prjScn.items is not None:
-                items = xmlScn.find('Items')
-                try:
-                    for oldItId in items.findall('ItemID'):
-                        items.remove(oldItId)
-                except(AttributeError):
-                    items = ET.SubElement(xmlScn, 'Items')
-                for itId in prjScn.items:
-                    ET.SubElement(items, 'ItemID').text = itId
-
-            """ Removing empty characters/locations/items entries
-            
+            # An empty list removes the element; no empty tag is written.
             if prjScn.characters is not None:
                 characters = xmlScn.find('Characters')
                 if characters is not None:
-                    for oldCrId in characters.findall('CharID'):
-                        characters.remove(oldCrId)
+                    del characters[:]
                 if prjScn.characters:
                     if characters is None:
-                        characters = ET.SubElement(xmlScn, 'Characters')
-                    for crId in prjScn.characters:
-                        ET.SubElement(characters, 'CharID').text = crId
+                        characters = SubElement(xmlScn, 'Characters')
+                    add_id_children(characters, 'CharID', prjScn.characters)
                 elif characters is not None:
-                    xmlScn.remove(xmlScn.find('Characters'))
+                    xmlScn.remove(characters)
 
             if prjScn.locations is not None:
                 locations = xmlScn.find('Locations')
                 if locations is not None:
-                    for oldLcId in locations.findall('LocID'):
-                        locations.remove(oldLcId)
+                    del locations[:]
                 if prjScn.locations:
                     if locations is None:
-                        locations = ET.SubElement(xmlScn, 'Locations')
-                    for lcId in prjScn.locations:
-                        ET.SubElement(locations, 'LocID').text = lcId
+                        locations = SubElement(xmlScn, 'Locations')
+                    add_id_children(locations, 'LocID', prjScn.locations)
                 elif locations is not None:
-                    xmlScn.remove(xmlScn.find('Locations'))
+                    xmlScn.remove(locations)
 
             if prjScn.items is not None:
                 items = xmlScn.find('Items')
                 if items is not None:
-                    for oldItId in items.findall('ItemID'):
-                        items.remove(oldItId)
+                    del items[:]
                 if prjScn.items:
                     if items is None:
-                        items = ET.SubElement(xmlScn, 'Items')
-                    for itId in prjScn.items:
-                        ET.SubElement(items, 'ItemID').text = itId
+                        items = SubElement(xmlScn, 'Items')
+                    add_id_children(items, 'ItemID', prjScn.items)
                 elif items is not None:
-            
-            """
+                    xmlScn.remove(items)
+
 
         def build_chapter_subtree(xmlChp, prjChp, sortOrder):
             # This is how yWriter 7.1.3.0 writes the chapter type:
@@ -1064,7 +1058,7 @@ class Yw7File(File):
                 try:
                     chFields.find('Field_SuppressChapterTitle').text = '1'
                 except(AttributeError):
-                    ET.SubElement(chFields, 'Field_SuppressChapterTitle').text = '1'
+                    SubElement(chFields, 'Field_SuppressChapterTitle').text = '1'
             elif chFields is not None:
                 if chFields.find('Field_SuppressChapterTitle') is not None:
                     chFields.find('Field_SuppressChapterTitle').text = '0'
@@ -1076,7 +1070,7 @@ class Yw7File(File):
                 try:
                     chFields.find('Field_SuppressChapterBreak').text = '1'
                 except(AttributeError):
-                    ET.SubElement(chFields, 'Field_SuppressChapterBreak').text = '1'
+                    SubElement(chFields, 'Field_SuppressChapterBreak').text = '1'
             elif chFields is not None:
                 if chFields.find('Field_SuppressChapterBreak') is not None:
                     chFields.find('Field_SuppressChapterBreak').text = '0'
@@ -1088,7 +1082,7 @@ class Yw7File(File):
                 try:
                     chFields.find('Field_IsTrash').text = '1'
                 except(AttributeError):
-                    ET.SubElement(chFields, 'Field_IsTrash').text = '1'
+                    SubElement(chFields, 'Field_IsTrash').text = '1'
 
             elif chFields is not None:
                 if chFields.find('Field_IsTrash') is not None:
@@ -1103,12 +1097,16 @@ class Yw7File(File):
                     try:
                         chFields.find(field).text = prjChp.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(chFields, field).text = prjChp.kwVar[field]
+                        SubElement(chFields, field).text = prjChp.kwVar[field]
                 elif chFields is not None:
                     try:
                         chFields.remove(chFields.find(field))
                     except:
                         pass
+
+            # Remove an empty Fields element left behind.
+            if chFields is not None and not len(chFields):
+                xmlChp.remove(chFields)
             if xmlChp.find('Fields') is not None:
                 i += 1
 
@@ -1136,37 +1134,26 @@ class Yw7File(File):
             if prjChp.srtScenes:
                 xmlScnList = ET.Element('Scenes')
                 xmlChp.insert(i, xmlScnList)
-                for scId in prjChp.srtScenes:
-                    ET.SubElement(xmlScnList, 'ScID').text = scId
+                add_id_children(xmlScnList, 'ScID', prjChp.srtScenes)
 
         def build_location_subtree(xmlLoc, prjLoc, sortOrder):
-            if prjLoc.title is not None:
-                ET.SubElement(xmlLoc, 'Title').text = prjLoc.title
-
-            if prjLoc.image is not None:
-                ET.SubElement(xmlLoc, 'ImageFile').text = prjLoc.image
-
-            if prjLoc.desc is not None:
-                ET.SubElement(xmlLoc, 'Desc').text = prjLoc.desc
-
-            if prjLoc.aka is not None:
-                ET.SubElement(xmlLoc, 'AKA').text = prjLoc.aka
-
-            if prjLoc.tags is not None:
-                ET.SubElement(xmlLoc, 'Tags').text = list_to_string(prjLoc.tags)
+            for attrName, tag in self._WLD_FIELDS:
+                text = getattr(prjLoc, attrName)
+                if text is not None:
+                    SubElement(xmlLoc, tag).text = text
 
-            ET.SubElement(xmlLoc, 'SortOrder').text = str(sortOrder)
+            SubElement(xmlLoc, 'SortOrder').text = str(sortOrder)
 
             #--- Write location custom fields.
             lcFields = xmlLoc.find('Fields')
             for field in self.LOC_KWVAR:
-                if self.novel.locations[lcId].kwVar.get(field, None):
+                if prjLoc.kwVar.get(field, None):
                     if lcFields is None:
-                        lcFields = ET.SubElement(xmlLoc, 'Fields')
+                        lcFields = SubElement(xmlLoc, 'Fields')
                     try:
-                        lcFields.find(field).text = self.novel.locations[lcId].kwVar[field]
+                        lcFields.find(field).text = prjLoc.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(lcFields, field).text = self.novel.locations[lcId].kwVar[field]
+                        SubElement(lcFields, field).text = prjLoc.kwVar[field]
                 elif lcFields is not None:
                     try:
                         lcFields.remove(lcFields.find(field))
@@ -1175,12 +1162,12 @@ class Yw7File(File):
 
         def build_prjNote_subtree(xmlPnt, prjPnt, sortOrder):
             if prjPnt.title is not None:
-                ET.SubElement(xmlPnt, 'Title').text = prjPnt.title
+                SubElement(xmlPnt, 'Title').text = prjPnt.title
 
             if prjPnt.desc is not None:
-                ET.SubElement(xmlPnt, 'Desc').text = prjPnt.desc
+                SubElement(xmlPnt, 'Desc').text = prjPnt.desc
 
-            ET.SubElement(xmlPnt, 'SortOrder').text = str(sortOrder)
+            SubElement(xmlPnt, 'SortOrder').text = str(sortOrder)
 
         def add_projectvariable(title, desc, tags):
             # Note:
@@ -1188,40 +1175,30 @@ class Yw7File(File):
             pvId = create_id(prjVars)
             prjVars.append(pvId)
             # side effect
-            projectvar = ET.SubElement(projectvars, 'PROJECTVAR')
-            ET.SubElement(projectvar, 'ID').text = pvId
-            ET.SubElement(projectvar, 'Title').text = title
-            ET.SubElement(projectvar, 'Desc').text = desc
-            ET.SubElement(projectvar, 'Tags').text = tags
+            projectvar = SubElement(projectvars, 'PROJECTVAR')
+            SubElement(projectvar, 'ID').text = pvId
+            SubElement(projectvar, 'Title').text = title
+            SubElement(projectvar, 'Desc').text = desc
+            SubElement(projectvar, 'Tags').text = tags
 
         def build_item_subtree(xmlItm, prjItm, sortOrder):
-            if prjItm.title is not None:
-                ET.SubElement(xmlItm, 'Title').text = prjItm.title
-
-            if prjItm.image is not None:
-                ET.SubElement(xmlItm, 'ImageFile').text = prjItm.image
-
-            if prjItm.desc is not None:
-                ET.SubElement(xmlItm, 'Desc').text = prjItm.desc
-
-            if prjItm.aka is not None:
-                ET.SubElement(xmlItm, 'AKA').text = prjItm.aka
-
-            if prjItm.tags is not None:
-                ET.SubElement(xmlItm, 'Tags').text = list_to_string(prjItm.tags)
+            for attrName, tag in self._WLD_FIELDS:
+                text = getattr(prjItm, attrName)
+                if text is not None:
+                    SubElement(xmlItm, tag).text = text
 
-            ET.SubElement(xmlItm, 'SortOrder').text = str(sortOrder)
+            SubElement(xmlItm, 'SortOrder').text = str(sortOrder)
 
             #--- Write item custom fields.
             itFields = xmlItm.find('Fields')
             for field in self.ITM_KWVAR:
-                if self.novel.items[itId].kwVar.get(field, None):
+                if prjItm.kwVar.get(field, None):
                     if itFields is None:
-                        itFields = ET.SubElement(xmlItm, 'Fields')
+                        itFields = SubElement(xmlItm, 'Fields')
                     try:
-                        itFields.find(field).text = self.novel.items[itId].kwVar[field]
+                        itFields.find(field).text = prjItm.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(itFields, field).text = self.novel.items[itId].kwVar[field]
+                        SubElement(itFields, field).text = prjItm.kwVar[field]
                 elif itFields is not None:
                     try:
                         itFields.remove(itFields.find(field))
@@ -1229,48 +1206,34 @@ class Yw7File(File):
                         pass
 
         def build_character_subtree(xmlCrt, prjCrt, sortOrder):
-            if prjCrt.title is not None:
-                ET.SubElement(xmlCrt, 'Title').text = prjCrt.title
-
-            if prjCrt.desc is not None:
-                ET.SubElement(xmlCrt, 'Desc').text = prjCrt.desc
-
-            if prjCrt.image is not None:
-                ET.SubElement(xmlCrt, 'ImageFile').text = prjCrt.image
-
-            ET.SubElement(xmlCrt, 'SortOrder').text = str(sortOrder)
-
-            if prjCrt.notes is not None:
-                ET.SubElement(xmlCrt, 'Notes').text = prjCrt.notes
-
-            if prjCrt.aka is not None:
-                ET.SubElement(xmlCrt, 'AKA').text = prjCrt.aka
-
-            if prjCrt.tags is not None:
-                ET.SubElement(xmlCrt, 'Tags').text = list_to_string(prjCrt.tags)
-
-            if prjCrt.bio is not None:
-                ET.SubElement(xmlCrt, 'Bio').text = prjCrt.bio
-
-            if prjCrt.goals is not None:
-                ET.SubElement(xmlCrt, 'Goals').text = prjCrt.goals
-
-            if prjCrt.fullName is not None:
-                ET.SubElement(xmlCrt, 'FullName').text = prjCrt.fullName
+            for tag, text in (
+                    ('Title', prjCrt.title),
+                    ('Desc', prjCrt.desc),
+                    ('ImageFile', prjCrt.image),
+                    ('SortOrder', str(sortOrder)),
+                    ('Notes', prjCrt.notes),
+                    ('AKA', prjCrt.aka),
+                    ('Tags', prjCrt.tagsStr),
+                    ('Bio', prjCrt.bio),
+                    ('Goals', prjCrt.goals),
+                    ('FullName', prjCrt.fullName),
+                    ):
+                if text is not None:
+                    SubElement(xmlCrt, tag).text = text
 
             if prjCrt.isMajor:
-                ET.SubElement(xmlCrt, 'Major').text = '-1'
+                SubElement(xmlCrt, 'Major').text = '-1'
 
             #--- Write character custom fields.
             crFields = xmlCrt.find('Fields')
             for field in self.CRT_KWVAR:
-                if self.novel.characters[crId].kwVar.get(field, None):
+                if prjCrt.kwVar.get(field, None):
                     if crFields is None:
-                        crFields = ET.SubElement(xmlCrt, 'Fields')
+                        crFields = SubElement(xmlCrt, 'Fields')
                     try:
-                        crFields.find(field).text = self.novel.characters[crId].kwVar[field]
+                        crFields.find(field).text = prjCrt.kwVar[field]
                     except(AttributeError):
-                        ET.SubElement(crFields, field).text = self.novel.characters[crId].kwVar[field]
+                        SubElement(crFields, field).text = prjCrt.kwVar[field]
                 elif crFields is not None:
                     try:
                         crFields.remove(crFields.find(field))
@@ -1282,68 +1245,68 @@ class Yw7File(File):
             try:
                 xmlPrj.find('Ver').text = VER
             except(AttributeError):
-                ET.SubElement(xmlPrj, 'Ver').text = VER
+                SubElement(xmlPrj, 'Ver').text = VER
 
             if self.novel.title is not None:
                 try:
                     xmlPrj.find('Title').text = self.novel.title
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'Title').text = self.novel.title
+                    SubElement(xmlPrj, 'Title').text = self.novel.title
 
             if self.novel.desc is not None:
                 try:
                     xmlPrj.find('Desc').text = self.novel.desc
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'Desc').text = self.novel.desc
+                    SubElement(xmlPrj, 'Desc').text = self.novel.desc
 
             if self.novel.authorName is not None:
                 try:
                     xmlPrj.find('AuthorName').text = self.novel.authorName
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'AuthorName').text = self.novel.authorName
+                    SubElement(xmlPrj, 'AuthorName').text = self.novel.authorName
 
             if self.novel.authorBio is not None:
                 try:
                     xmlPrj.find('Bio').text = self.novel.authorBio
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'Bio').text = self.novel.authorBio
+                    SubElement(xmlPrj, 'Bio').text = self.novel.authorBio
 
             if self.novel.fieldTitle1 is not None:
                 try:
                     xmlPrj.find('FieldTitle1').text = self.novel.fieldTitle1
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'FieldTitle1').text = self.novel.fieldTitle1
+                    SubElement(xmlPrj, 'FieldTitle1').text = self.novel.fieldTitle1
 
             if self.novel.fieldTitle2 is not None:
                 try:
                     xmlPrj.find('FieldTitle2').text = self.novel.fieldTitle2
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'FieldTitle2').text = self.novel.fieldTitle2
+                    SubElement(xmlPrj, 'FieldTitle2').text = self.novel.fieldTitle2
 
             if self.novel.fieldTitle3 is not None:
                 try:
                     xmlPrj.find('FieldTitle3').text = self.novel.fieldTitle3
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'FieldTitle3').text = self.novel.fieldTitle3
+                    SubElement(xmlPrj, 'FieldTitle3').text = self.novel.fieldTitle3
 
             if self.novel.fieldTitle4 is not None:
                 try:
                     xmlPrj.find('FieldTitle4').text = self.novel.fieldTitle4
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'FieldTitle4').text = self.novel.fieldTitle4
+                    SubElement(xmlPrj, 'FieldTitle4').text = self.novel.fieldTitle4
 
             #--- Write word target data.
             if self.novel.wordCountStart is not None:
                 try:
                     xmlPrj.find('WordCountStart').text = str(self.novel.wordCountStart)
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'WordCountStart').text = str(self.novel.wordCountStart)
+                    SubElement(xmlPrj, 'WordCountStart').text = str(self.novel.wordCountStart)
 
             if self.novel.wordTarget is not None:
                 try:
                     xmlPrj.find('WordTarget').text = str(self.novel.wordTarget)
                 except(AttributeError):
-                    ET.SubElement(xmlPrj, 'WordTarget').text = str(self.novel.wordTarget)
+                    SubElement(xmlPrj, 'WordTarget').text = str(self.novel.wordTarget)
 
             #--- Write project custom fields.
 
@@ -1356,11 +1319,11 @@ class Yw7File(File):
                 setting = self.novel.kwVar.get(field, None)
                 if setting:
                     if prjFields is None:
-                        prjFields = ET.SubElement(xmlPrj, 'Fields')
+                        prjFields = SubElement(xmlPrj, 'Fields')
                     try:
                         prjFields.find(field).text = setting
                     except(AttributeError):
-                        ET.SubElement(prjFields, field).text = setting
+                        SubElement(prjFields, field).text = setting
                 else:
                     try:
                         prjFields.remove(prjFields.find(field))
@@ -1383,13 +1346,13 @@ class Yw7File(File):
         except(AttributeError):
             # Build a new tree.
             root = ET.Element(TAG)
-            xmlPrj = ET.SubElement(root, 'PROJECT')
-            locations = ET.SubElement(root, 'LOCATIONS')
-            items = ET.SubElement(root, 'ITEMS')
-            characters = ET.SubElement(root, 'CHARACTERS')
-            prjNotes = ET.SubElement(root, 'PROJECTNOTES')
-            scenes = ET.SubElement(root, 'SCENES')
-            chapters = ET.SubElement(root, 'CHAPTERS')
+            xmlPrj = SubElement(root, 'PROJECT')
+            locations = SubElement(root, 'LOCATIONS')
+            items = SubElement(root, 'ITEMS')
+            characters = SubElement(root, 'CHARACTERS')
+            prjNotes = SubElement(root, 'PROJECTNOTES')
+            scenes = SubElement(root, 'SCENES')
+            chapters = SubElement(root, 'CHAPTERS')
 
         #--- Process project attributes.
 
@@ -1399,45 +1362,42 @@ class Yw7File(File):
 
         # Remove LOCATION entries in order to rewrite
         # the LOCATIONS section in a modified sort order.
-        for xmlLoc in locations.findall('LOCATION'):
-            locations.remove(xmlLoc)
+        del locations[:]
 
         # Add the new XML location subtrees to the project tree.
         sortOrder = 0
         for lcId in self.novel.srtLocations:
             sortOrder += 1
-            xmlLoc = ET.SubElement(locations, 'LOCATION')
-            ET.SubElement(xmlLoc, 'ID').text = lcId
+            xmlLoc = SubElement(locations, 'LOCATION')
+            SubElement(xmlLoc, 'ID').text = lcId
             build_location_subtree(xmlLoc, self.novel.locations[lcId], sortOrder)
 
         #--- Process items.
 
         # Remove ITEM entries in order to rewrite
         # the ITEMS section in a modified sort order.
-        for xmlItm in items.findall('ITEM'):
-            items.remove(xmlItm)
+        del items[:]
 
         # Add the new XML item subtrees to the project tree.
         sortOrder = 0
         for itId in self.novel.srtItems:
             sortOrder += 1
-            xmlItm = ET.SubElement(items, 'ITEM')
-            ET.SubElement(xmlItm, 'ID').text = itId
+            xmlItm = SubElement(items, 'ITEM')
+            SubElement(xmlItm, 'ID').text = itId
             build_item_subtree(xmlItm, self.novel.items[itId], sortOrder)
 
         #--- Process characters.
 
         # Remove CHARACTER entries in order to rewrite
         # the CHARACTERS section in a modified sort order.
-        for xmlCrt in characters.findall('CHARACTER'):
-            characters.remove(xmlCrt)
+        del characters[:]
 
         # Add the new XML character subtrees to the project tree.
         sortOrder = 0
         for crId in self.novel.srtCharacters:
             sortOrder += 1
-            xmlCrt = ET.SubElement(characters, 'CHARACTER')
-            ET.SubElement(xmlCrt, 'ID').text = crId
+            xmlCrt = SubElement(characters, 'CHARACTER')
+            SubElement(xmlCrt, 'ID').text = crId
             build_character_subtree(xmlCrt, self.novel.characters[crId], sortOrder)
 
         #--- Process project notes.
@@ -1445,19 +1405,18 @@ class Yw7File(File):
         # Remove PROJECTNOTE entries in order to rewrite
         # the PROJECTNOTES section in a modified sort order.
         if prjNotes is not None:
-            for xmlPnt in prjNotes.findall('PROJECTNOTE'):
-                prjNotes.remove(xmlPnt)
+            del prjNotes[:]
             if not self.novel.srtPrjNotes:
                 root.remove(prjNotes)
         elif self.novel.srtPrjNotes:
-            prjNotes = ET.SubElement(root, 'PROJECTNOTES')
+            prjNotes = SubElement(root, 'PROJECTNOTES')
         if self.novel.srtPrjNotes:
             # Add the new XML prjNote subtrees to the project tree.
             sortOrder = 0
             for pnId in self.novel.srtPrjNotes:
                 sortOrder += 1
-                xmlPnt = ET.SubElement(prjNotes, 'PROJECTNOTE')
-                ET.SubElement(xmlPnt, 'ID').text = pnId
+                xmlPnt = SubElement(prjNotes, 'PROJECTNOTE')
+                SubElement(xmlPnt, 'ID').text = pnId
                 build_prjNote_subtree(xmlPnt, self.novel.projectNotes[pnId], sortOrder)
 
         #--- Process project variables.
@@ -1465,7 +1424,7 @@ class Yw7File(File):
             self.novel.check_locale()
             projectvars = root.find('PROJECTVARS')
             if projectvars is None:
-                projectvars = ET.SubElement(root, 'PROJECTVARS')
+                projectvars = SubElement(root, 'PROJECTVARS')
             prjVars = []
             # list of all project variable IDs
             languages = self.novel.languages.copy()
@@ -1520,15 +1479,26 @@ class Yw7File(File):
         for xmlScn in scenes.findall('SCENE'):
             scId = xmlScn.find('ID').text
             xmlScenes[scId] = xmlScn
-            scenes.remove(xmlScn)
+        del scenes[:]
+
+        # Map each scene ID to the ID of the chapter containing it,
+        # so the scene builder gets along without a chapter scan.
+        sceneToChapter = {}
+        for chId, prjChp in self.novel.chapters.items():
+            for chScId in prjChp.srtScenes:
+                if not chScId in sceneToChapter:
+                    sceneToChapter[chScId] = chId
 
         # Add the new XML scene subtrees to the project tree.
-        for scId in self.novel.scenes:
-            if not scId in xmlScenes:
-                xmlScenes[scId] = ET.Element('SCENE')
-                ET.SubElement(xmlScenes[scId], 'ID').text = scId
-            build_scene_subtree(xmlScenes[scId], self.novel.scenes[scId])
-            scenes.append(xmlScenes[scId])
+        for scId, prjScn in self.novel.scenes.items():
+            if scId in xmlScenes:
+                xmlScn = xmlScenes[scId]
+            else:
+                xmlScn = ET.Element('SCENE')
+                SubElement(xmlScn, 'ID').text = scId
+                xmlScenes[scId] = xmlScn
+            build_scene_subtree(xmlScn, prjScn)
+            scenes.append(xmlScn)
 
         #--- Process chapters.
 
@@ -1537,36 +1507,48 @@ class Yw7File(File):
         for xmlChp in chapters.findall('CHAPTER'):
             chId = xmlChp.find('ID').text
             xmlChapters[chId] = xmlChp
-            chapters.remove(xmlChp)
+        del chapters[:]
 
         # Add the new XML chapter subtrees to the project tree.
         sortOrder = 0
         for chId in self.novel.srtChapters:
             sortOrder += 1
-            if not chId in xmlChapters:
-                xmlChapters[chId] = ET.Element('CHAPTER')
-                ET.SubElement(xmlChapters[chId], 'ID').text = chId
-            build_chapter_subtree(xmlChapters[chId], self.novel.chapters[chId], sortOrder)
-            chapters.append(xmlChapters[chId])
+            if chId in xmlChapters:
+                xmlChp = xmlChapters[chId]
+            else:
+                xmlChp = ET.Element('CHAPTER')
+                SubElement(xmlChp, 'ID').text = chId
+                xmlChapters[chId] = xmlChp
+            build_chapter_subtree(xmlChp, self.novel.chapters[chId], sortOrder)
+            chapters.append(xmlChp)
 
         # Modify the scene contents of an existing xml element tree.
-        for scn in root.iter('SCENE'):
-            scId = scn.find('ID').text
-            if self.novel.scenes[scId].sceneContent is not None:
-                scn.find('SceneContent').text = self.novel.scenes[scId].sceneContent
-                scn.find('WordCount').text = str(self.novel.scenes[scId].wordCount)
-                scn.find('LetterCount').text = str(self.novel.scenes[scId].letterCount)
-            try:
-                scn.remove(scn.find('RTFFile'))
-            except:
-                pass
+        # The scene subtrees are still at hand in xmlScenes, so there is
+        # no need to search the tree that is about to be serialized.
+        for scId, prjScn in self.novel.scenes.items():
+            xmlScn = xmlScenes[scId]
+            sceneContent = prjScn.sceneContent
+            if sceneContent is not None:
+                xmlContent = xmlScn.find('SceneContent')
+                if xmlContent.text != sceneContent:
+                    # Unchanged content keeps its counters, too.
+                    xmlContent.text = sceneContent
+                    xmlScn.find('WordCount').text = prjScn.wordCountStr
+                    xmlScn.find('LetterCount').text = prjScn.letterCountStr
+            xmlRtf = xmlScn.find('RTFFile')
+            if xmlRtf is not None:
+                xmlScn.remove(xmlRtf)
 
         indent(root)
-        self.tree = ET.ElementTree(root)
+        if self.tree is None:
+            self.tree = ET.ElementTree(root)
+        # Otherwise the existing tree wraps this root already.
 
     def _write_element_tree(self, ywProject):
         """Write back the xml element tree to a .yw7 xml file located at filePath.
         
+        Serialize the tree in memory, postprocess the text, and write the
+        file in one go, instead of rewriting the file just written.
         Raise the "Error" exception in case of error. 
         """
         backedUp = False
@@ -1578,43 +1560,32 @@ class Yw7File(File):
             else:
                 backedUp = True
         try:
-            ywProject.tree.write(ywProject.filePath, xml_declaration=False, encoding='utf-8')
+            xmlBytes = BytesIO()
+            ywProject.tree.write(xmlBytes, xml_declaration=False, encoding='utf-8')
+            text = self._format_xml(xmlBytes.getvalue().decode('utf-8'))
+            with open(ywProject.filePath, 'w', encoding='utf-8') as f:
+                f.write(text)
         except:
             if backedUp:
                 os.replace(f'{ywProject.filePath}.bak', ywProject.filePath)
             raise Error(f'{_("Cannot write file")}: "{norm_path(ywProject.filePath)}".')
 
-    def _postprocess_xml_file(self, filePath):
-        '''Postprocess an xml file created by ElementTree.
+    def _format_xml(self, text):
+        '''Postprocess the xml text created by ElementTree.
         
         Positional argument:
-            filePath: str -- path to xml file.
+            text: str -- serialized xml without declaration.
         
-        Read the xml file, put a header on top, insert the missing CDATA tags,
-        and replace xml entities by plain text (unescape). Overwrite the .yw7 xml file.
-        Raise the "Error" exception in case of error. 
-        
-        Note: The path is given as an argument rather than using self.filePath. 
-        So this routine can be used for yWriter-generated xml files other than .yw7 as well. 
+        Put a header on top, insert the missing CDATA tags,
+        and replace xml entities by plain text (unescape).
+        Return the postprocessed text.
         '''
-        with open(filePath, 'r', encoding='utf-8') as f:
-            text = f.read()
-        lines = text.split('\n')
-        newlines = ['<?xml version="1.0" encoding="utf-8"?>']
-        for line in lines:
-            for tag in self._CDATA_TAGS:
-                line = re.sub(f'\<{tag}\>', f'<{tag}><![CDATA[', line)
-                line = re.sub(f'\<\/{tag}\>', f']]></{tag}>', line)
-            newlines.append(line)
-        text = '\n'.join(newlines)
+        text = self._CDATA_OPEN.sub('<\\1><![CDATA[', text)
+        text = self._CDATA_CLOSE.sub(']]></\\1>', text)
+        text = f'<?xml version="1.0" encoding="utf-8"?>\n{text}'
         text = text.replace('[CDATA[ \n', '[CDATA[')
         text = text.replace('\n]]', ']]')
-        text = unescape(text)
-        try:
-            with open(filePath, 'w', encoding='utf-8') as f:
-                f.write(text)
-        except:
-            raise Error(f'{_("Cannot write file")}: "{norm_path(filePath)}".')
+        return unescape(text)
 
     def _strip_spaces(self, lines):
         """Local helper method.
@@ -1624,10 +1595,7 @@ class Yw7File(File):
 
         Return lines with leading and trailing spaces removed.
         """
-        stripped = []
-        for line in lines:
-            stripped.append(line.strip())
-        return stripped
+        return [line.strip() for line in lines]
 
     def adjust_scene_types(self):
         """Make sure that scenes in non-"Normal" chapters inherit the chapter's type."""
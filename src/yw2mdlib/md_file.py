@@ -6,12 +6,16 @@ Published under the MIT License (https://opensource.org/licenses/mit-license.php
 """
 import os
 import re
+from typing import Pattern
 
 from pywriter.pywriter_globals import *
 from pywriter.file.file_export import FileExport
 from pywriter.model.chapter import Chapter
 from pywriter.model.scene import Scene
 
+FORMAT_TAGS: Pattern = re.compile('\[\/?[hcrsu]\d*\]', re.ASCII)
+# highlighting, alignment, and underline tags, to be removed on export
+
 
 class MdFile(FileExport):
     """Markdown file representation.
@@ -101,7 +105,7 @@ class MdFile(FileExport):
         try:
             for yw, md in MD_REPLACEMENTS:
                 text = text.replace(yw, md)
-            text = re.sub(r'\[\/*[h|c|r|s|u]\d*\]', '', text)
+            text = FORMAT_TAGS.sub('', text)
             # Remove highlighting, alignment, and underline tags
         except AttributeError:
             text = ''
@@ -175,8 +179,12 @@ class MdFile(FileExport):
         else:
             commentStart = '/*'
             commentEnd = '*/'
+        sceneDivider = self.SCENE_DIVIDER
         for mdLine in mdLines:
-            if mdLine.startswith('#'):
+            # Check the first character before scanning the whole line;
+            # most lines are body text and match none of the anchors.
+            firstChar = mdLine[:1]
+            if firstChar == '#':
 
                 # Write previous scene.
                 write_scene_content(scId, lines)
@@ -195,7 +203,7 @@ class MdFile(FileExport):
                 else:
                     self.novel.chapters[chId].chLevel = 0
                 self.novel.chapters[chId].srtScenes = []
-            elif self.SCENE_DIVIDER in mdLine:
+            elif firstChar == sceneDivider[0] and sceneDivider in mdLine:
                 # Write previous scene.
                 write_scene_content(scId, lines)
                 scId = None
@@ -214,7 +222,9 @@ class MdFile(FileExport):
                     try:
                         scTitle, scContent = mdLine.split(
                             sep=commentEnd, maxsplit=1)
-                        self.novel.scenes[scId].title = scTitle.lstrip(commentStart)
+                        self.novel.scenes[scId].title = scTitle[len(commentStart):]
+                        # Slice off the prefix; lstrip would treat it
+                        # as a character set and eat from the title.
                         lines = [scContent]
                     except:
                         lines = [mdLine]
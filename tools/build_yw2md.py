@@ -16,10 +16,11 @@ TARGET_FILE = f'{BUILD}yw2md.pyw'
 
 
 def main():
-    # inliner.run(SOURCE_FILE, TARGET_FILE, 'yw2mdlib', '../src/', copyPyWriter=True)
-    # inliner.run(TARGET_FILE, TARGET_FILE, 'pywriter', '../../PyWriter/src/', copyPyWriter=True)
-    inliner.run(SOURCE_FILE, TARGET_FILE, 'yw2mdlib', '../src/')
-    inliner.run(TARGET_FILE, TARGET_FILE, 'pywriter', '../src/')
+    # inliner.run(SOURCE_FILE, TARGET_FILE,
+    #             {'yw2mdlib': '../src/', 'pywriter': '../../PyWriter/src/'},
+    #             copyPyWriter=True)
+    inliner.run(SOURCE_FILE, TARGET_FILE,
+                {'yw2mdlib': '../src/', 'pywriter': '../src/'})
     print('Done.')
 
 
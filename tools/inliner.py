@@ -12,7 +12,7 @@ import os
 from shutil import copyfile
 
 
-def inline_module(file, package, packagePath, text, processedModules, copyPyWriter):
+def inline_module(file, packages, text, processedModules, copyPyWriter):
     with open(file, 'r', encoding='utf-8') as f:
         print(f'Processing "{file}"...')
         if copyPyWriter:
@@ -25,13 +25,18 @@ def inline_module(file, package, packagePath, text, processedModules, copyPyWrit
         inSuppressedComment = False
         inHeader = True
         # document parsing always starts in the header
+        isInlinedModule = False
+        for package in packages:
+            if package in file:
+                isInlinedModule = True
+                break
         for line in lines:
             if line.startswith('# do_not_inline'):
                 break
 
             if (inHeader) and line.count('"""') == 1:
                 # Beginning or end of a docstring
-                if package in file:
+                if isInlinedModule:
                     # This is not the root script
                     # so suppress the module's docstring
                     if inSuppressedComment:
@@ -44,20 +49,25 @@ def inline_module(file, package, packagePath, text, processedModules, copyPyWrit
                 else:
                     text = f'{text}{line}'
             elif not inSuppressedComment:
-                if package in file:
+                if isInlinedModule:
                     if 'main()' in line:
                         return(text)
                     if '__main__' in line:
                         return(text)
                 if 'import' in line:
                     importModule = re.match('from (.+?) import.+', line)
-                    if (importModule is not None) and (package in importModule.group(1)):
-                        packageName = re.sub('\.', '\/', importModule.group(1))
-                        moduleName = f'{packagePath}{packageName}'
+                    moduleName = None
+                    if importModule is not None:
+                        for package in packages:
+                            if package in importModule.group(1):
+                                packageName = importModule.group(1).replace('.', '/')
+                                moduleName = f'{packages[package]}{packageName}'
+                                break
+                    if moduleName is not None:
                         if not (moduleName in processedModules):
                             processedModules.append(moduleName)
                             text = inline_module(
-                                f'{moduleName}.py', package, packagePath, text, processedModules, copyPyWriter)
+                                f'{moduleName}.py', packages, text, processedModules, copyPyWriter)
                     elif line.lstrip().startswith('import'):
                         moduleName = line.replace('import ', '').rstrip()
                         if not (moduleName in processedModules):
@@ -70,10 +80,16 @@ def inline_module(file, package, packagePath, text, processedModules, copyPyWrit
         return(text)
 
 
-def run(sourceFile, targetFile, package, packagePath, copyPyWriter=False):
+def run(sourceFile, targetFile, packages, copyPyWriter=False):
+    """Inline all packages in one traversal.
+    
+    packages is a dict: package name -> source path. Imports from any
+    of the packages are resolved recursively in a single pass, so the
+    target file is parsed and written only once.
+    """
     text = ''
     processedModules = []
-    text = inline_module(sourceFile, package, packagePath, text, processedModules, copyPyWriter)
+    text = inline_module(sourceFile, packages, text, processedModules, copyPyWriter)
     with open(targetFile, 'w', encoding='utf-8') as f:
         print(f'Writing "{targetFile}"...\n')
         f.write(text)